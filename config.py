@@ -48,6 +48,7 @@ class Config:
     MAX_PROCESSES_TO_DISPLAY = 200  # 最大显示进程数
     MAX_STARTUP_ITEMS_TO_DISPLAY = 200  # 最大显示启动项数
     MAX_NETWORK_CONNECTIONS_TO_DISPLAY = 200  # 最大显示网络连接数
+    MAX_FILE_OPERATIONS_TO_DISPLAY = 5000  # 文件监控最多保留的操作记录数
     
     # 可疑检测配置
     SUSPICIOUS_NAME_PATTERNS = [
@@ -79,6 +80,7 @@ class Config:
     # 文件监控配置
     FILE_MONITOR_CONFIG_FILE = "config/file_monitor_config.json"
     FILE_MONITOR_SIMULATION = False  # 文件监控模拟模式（用于测试）
+    FILE_MONITOR_PATHS = [os.environ.get('TEMP', os.path.expanduser('~'))]  # 实际模式下监控的目录
     
     # 注册表监控配置
     REGISTRY_MONITOR_CONFIG_FILE = "config/registry_monitor_config.json"
@@ -93,12 +95,15 @@ class Config:
     MODULES_MONITOR_CONFIG_FILE = "config/modules_monitor_config.json"
     
     # 性能监控配置
-    PERFORMANCE_MONITOR_INTERVAL = 1000  # 性能监控间隔（毫秒）
+    PERFORMANCE_MONITOR_INTERVAL = 2000  # 性能监控间隔（毫秒）
     PERFORMANCE_HISTORY_SIZE = 300  # 性能历史数据大小
     
     # 内存优化配置
     ENABLE_MEMORY_OPTIMIZATION = True
     MEMORY_CLEANUP_INTERVAL = 30000  # 内存清理间隔（毫秒）
+    GC_THRESHOLD = (50000, 20, 20)  # 垃圾回收各代阈值，放宽第0代以减少频繁的小回收
+    GC_MIN_GEN0 = 1000  # 定时清理时第0代新增对象少于该值且
+    GC_MIN_GEN1 = 5     # 第1代计数少于该值则跳过回收
     
     # 表格样式配置
     TABLE_ALTERNATING_ROW_COLORS = True  # 启用表格交替行颜色
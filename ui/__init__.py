@@ -3,18 +3,32 @@
 UI包初始化文件
 """
 
+import importlib
+
 __version__ = "1.0.0"
 
-# 导入所有UI模块
-from .main_window import MainWindow
-from .process_tab import ProcessTab
-from .network_tab import NetworkTab
-from .startup_tab import StartupTab
-from .registry_tab import RegistryTab
-from .file_monitor_tab import FileMonitorTab
-from .popup_blocker_tab import PopupBlockerTab
-from .modules_tab import ModulesTab
-from .sandbox_tab import SandboxTab
+# UI类 -> 所在模块，首次访问时才导入，避免导入本包时加载所有标签页模块
+_LAZY_IMPORTS = {
+    'MainWindow': '.main_window',
+    'ProcessTab': '.process_tab',
+    'NetworkTab': '.network_tab',
+    'StartupTab': '.startup_tab',
+    'RegistryTab': '.registry_tab',
+    'FileMonitorTab': '.file_monitor_tab',
+    'PopupBlockerTab': '.popup_blocker_tab',
+    'ModulesTab': '.modules_tab',
+    'SandboxTab': '.sandbox_tab',
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'MainWindow',
@@ -26,4 +40,4 @@ __all__ = [
     'PopupBlockerTab',
     'ModulesTab',
     'SandboxTab'
-]
\ No newline at end of file
+]
@@ -4,17 +4,13 @@
 提供增强的主界面和标签页管理功能，包含资源管理和性能优化
 """
 
-from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QWidget, QVBoxLayout, 
-                            QStatusBar, QMenuBar, QMenu, QAction, QMessageBox,
-                            QSplitter, QFrame, QToolBar, QSizePolicy, QLabel, QApplication)
-from PyQt5.QtCore import Qt, QUrl, pyqtSignal, QSize, QTimer
-from PyQt5.QtGui import QIcon, QFont, QPalette, QColor
+from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QWidget, QVBoxLayout,
+                            QAction, QMessageBox, QLabel)
+from PyQt5.QtCore import pyqtSignal, QTimer, QEvent, QThread
+import gc
 import logging
-import sys
-import os
-import ctypes  # 请求管理员权限
-import codecs  # 添加编码处理模块
-from datetime import datetime
+import importlib
+from functools import partial
 
 # 导入配置模块
 from config import Config
@@ -26,55 +22,143 @@ from utils.enhanced_system_utils import enhanced_system_utils
 logger = logging.getLogger(__name__)
 
 # 导入项目工具模块
-from utils.common_utils import show_error_message, show_info_message, show_warning_message
+from utils.common_utils import show_error_message, show_info_message
+from utils.decorators import safe_slot
+
+# 标签页定义：(属性名, 模块名, 类名, 标题)
+# 标签页模块在首次切换到该标签页时才导入，缩短主窗口启动时间
+_TAB_SPECS = (
+    ('process_tab', 'ui.process_tab', 'ProcessTab', "🔄 进程监控"),
+    ('network_tab', 'ui.network_tab', 'NetworkTab', "🌐 网络监控"),
+    ('startup_tab', 'ui.startup_tab', 'StartupTab', "🚀 启动项管理"),
+    ('registry_tab', 'ui.registry_tab', 'RegistryTab', "📋 注册表监控"),
+    ('file_monitor_tab', 'ui.file_monitor_tab', 'FileMonitorTab', "📁 文件监控"),
+    ('popup_blocker_tab', 'ui.popup_blocker_tab', 'PopupBlockerTab', "🚫 弹窗拦截"),
+    ('modules_tab', 'ui.modules_tab', 'ModulesTab', "🧩 模块信息"),
+    ('sandbox_tab', 'ui.sandbox_tab', 'SandboxTab', "🏖 沙箱分析"),
+)
+
+# 已加载的标签页类缓存
+_tab_class_cache = {}
+
+
+def _load_tab_class(module_name, class_name):
+    """
+    按需导入标签页类
+    
+    Args:
+        module_name (str): 模块名
+        class_name (str): 类名
+        
+    Returns:
+        type: 标签页类
+    """
+    tab_class = _tab_class_cache.get(class_name)
+    if tab_class is None:
+        tab_class = getattr(importlib.import_module(module_name), class_name)
+        _tab_class_cache[class_name] = tab_class
+        logger.info(f"✅ 标签页类 {class_name} 导入成功")
+    return tab_class
+
+# 配置项在导入时读取一次，窗口构造时不再重复查找
+_ENABLE_DELAYED_INIT = Config.ENABLE_DELAYED_INITIALIZATION
+_DELAYED_INIT_DELAY = Config.DELAYED_INIT_DELAY
+_ENABLE_MEMORY_OPTIMIZATION = getattr(Config, 'ENABLE_MEMORY_OPTIMIZATION', True)
+
+# 主定时器节拍（毫秒），即性能监控间隔；其余定时任务按节拍数调度
+_MASTER_TICK_INTERVAL = 5000
+_SYSTEM_INFO_TICKS = max(1, Config.SYSTEM_INFO_REFRESH_INTERVAL // _MASTER_TICK_INTERVAL)
+_MEMORY_CLEANUP_TICKS = max(1, Config.MEMORY_CLEANUP_INTERVAL // _MASTER_TICK_INTERVAL)
+
+# 内存清理轮换回收代数：每次回收第0代，每_GC_GEN1_CLEANUPS次回收到第1代，每_GC_FULL_CLEANUPS次完整回收
+_GC_GEN1_CLEANUPS = 10
+_GC_FULL_CLEANUPS = 60
+_GC_MIN_GEN0 = Config.GC_MIN_GEN0
+_GC_MIN_GEN1 = Config.GC_MIN_GEN1
+
+# 性能读数指数平滑系数
+_PERF_EMA_ALPHA = 0.3
+
+
+def _ema(prev, new, alpha):
+    """指数移动平均"""
+    return prev * (1.0 - alpha) + new * alpha
+
+# 主窗口样式表，模块加载时构建一次，所有窗口实例共享
+_MAIN_STYLESHEET = """
+    QMainWindow {
+        background-color: #f0f0f0;
+    }
+    QTabWidget::pane {
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+        background-color: #ffffff;
+    }
+    QTabBar::tab {
+        background-color: #e0e0e0;
+        border: 1px solid #cccccc;
+        border-bottom-color: #cccccc;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        min-width: 120px;
+        padding: 8px;
+        margin-right: 2px;
+    }
+    QTabBar::tab:selected {
+        background-color: #ffffff;
+        border-bottom-color: #ffffff;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #f0f0f0;
+    }
+    QToolBar {
+        border: none;
+        background-color: #f8f8f8;
+        spacing: 8px;
+        padding: 4px;
+    }
+    QMenuBar {
+        background-color: #2d2d2d;
+        color: white;
+    }
+    QMenuBar::item {
+        background-color: transparent;
+        padding: 4px 8px;
+    }
+    QMenuBar::item:selected {
+        background-color: #3d3d3d;
+    }
+    QMenuBar::item:pressed {
+        background-color: #4d4d4d;
+    }
+    QMenu {
+        background-color: #f8f8f8;
+        border: 1px solid #cccccc;
+    }
+    QMenu::item {
+        padding: 4px 20px;
+    }
+    QMenu::item:selected {
+        background-color: #4a90e2;
+        color: white;
+    }
+"""
+
+
+class ResourceSampleWorker(QThread):
+    """
+    后台线程用于采样和记录资源使用情况，避免阻塞UI线程
+    """
+    sample_finished = pyqtSignal()
+    
+    def run(self):
+        try:
+            enhanced_system_utils.resource_manager.log_resource_usage()
+            logger.info("资源优化完成")
+        except Exception as e:
+            logger.error(f"后台线程采样资源使用情况时出错: {e}")
+        self.sample_finished.emit()
 
-# 从UI包直接导入所有标签页类
-try:
-    from ui.process_tab import ProcessTab
-    from ui.network_tab import NetworkTab
-    from ui.startup_tab import StartupTab
-    from ui.registry_tab import RegistryTab
-    from ui.file_monitor_tab import FileMonitorTab
-    from ui.popup_blocker_tab import PopupBlockerTab
-    from ui.modules_tab import ModulesTab
-    from ui.sandbox_tab import SandboxTab
-    
-    logger.info("✅ 所有标签页类导入成功")
-    
-except ImportError as e:
-    logger.error(f"❌ 标签页类导入失败: {e}")
-    # 创建占位符类
-    class ProcessTab:
-        def __init__(self):
-            raise ImportError("ProcessTab导入失败")
-    
-    class NetworkTab:
-        def __init__(self):
-            raise ImportError("NetworkTab导入失败")
-    
-    class StartupTab:
-        def __init__(self):
-            raise ImportError("StartupTab导入失败")
-    
-    class RegistryTab:
-        def __init__(self):
-            raise ImportError("RegistryTab导入失败")
-    
-    class FileMonitorTab:
-        def __init__(self):
-            raise ImportError("FileMonitorTab导入失败")
-    
-    class PopupBlockerTab:
-        def __init__(self):
-            raise ImportError("PopupBlockerTab导入失败")
-    
-    class ModulesTab:
-        def __init__(self):
-            raise ImportError("ModulesTab导入失败")
-    
-    class SandboxTab:
-        def __init__(self):
-            raise ImportError("SandboxTab导入失败")
 
 class EnhancedMainWindow(QMainWindow):
     """增强版主窗口类"""
@@ -88,12 +172,23 @@ class EnhancedMainWindow(QMainWindow):
         self.setMinimumSize(1400, 900)  # 增大最小尺寸
         
         # 初始化状态
-        self.initialized_tabs = set()  # 记录已初始化的标签页
+        self.initialized_tabs = set()  # 记录已初始化的标签页属性名
         # 延迟初始化配置
-        self.enable_delayed_init = Config.ENABLE_DELAYED_INITIALIZATION
-        self.delayed_init_delay = Config.DELAYED_INIT_DELAY  # 500ms延迟
+        self.enable_delayed_init = _ENABLE_DELAYED_INIT
+        self.delayed_init_delay = _DELAYED_INIT_DELAY  # 500ms延迟
         self.current_tab_index = -1    # 当前标签页索引
-        self.tab_widgets = {}          # 保存标签页控件引用
+        # 以下按标签页属性名索引：标签页可拖动排序，位置索引会变化
+        self.tab_widgets = {}          # 标签页属性名 -> 标签页控件
+        self._refresh_dispatch = {}    # 标签页属性名 -> 刷新函数
+        self._tab_pages = {}           # 标签页属性名 -> 容器页
+        self._refresh_workers = {}     # 标签页 -> 标签页正在运行的后台刷新线程
+        self._refresh_all_pending = False
+        
+        # 复用同一个单次定时器执行延迟初始化，快速切换标签页时只保留最后一次请求
+        self._deferred_attr = None
+        self._deferred_init_timer = QTimer(self)
+        self._deferred_init_timer.setSingleShot(True)
+        self._deferred_init_timer.timeout.connect(self._do_deferred_init)
 
         # 初始化UI
         self.init_ui()
@@ -104,16 +199,16 @@ class EnhancedMainWindow(QMainWindow):
         # 延迟初始化第一个标签页
         QTimer.singleShot(100, self.init_first_tab)
         
-        # 设置内存清理定时器
-        if getattr(Config, 'ENABLE_MEMORY_OPTIMIZATION', True):
-            self.memory_cleanup_timer = QTimer()
-            self.memory_cleanup_timer.timeout.connect(self.cleanup_memory)
-            self.memory_cleanup_timer.start(Config.MEMORY_CLEANUP_INTERVAL)
-        
-        # 设置性能监控定时器
-        self.performance_monitor_timer = QTimer()
-        self.performance_monitor_timer.timeout.connect(self.monitor_performance)
-        self.performance_monitor_timer.start(5000)  # 每5秒监控一次性能
+        # 设置主定时器：性能监控、系统信息刷新和内存清理共用一个节拍
+        self.enable_memory_cleanup = _ENABLE_MEMORY_OPTIMIZATION
+        self._tick = 0
+        self._cleanup_count = 0  # 内存清理次数，用于轮换回收代数
+        self._cleanup_worker = None
+        self._cpu_ema = None  # 平滑后的CPU使用率
+        self._mem_ema = None  # 平滑后的内存使用率
+        self._master_timer = QTimer(self)
+        self._master_timer.timeout.connect(self._on_master_tick)
+        self._master_timer.start(_MASTER_TICK_INTERVAL)
         
         # 状态栏消息
         self.statusBar().showMessage("就绪")
@@ -121,6 +216,9 @@ class EnhancedMainWindow(QMainWindow):
     
     def init_ui(self):
         """初始化UI"""
+        # 创建菜单栏和工具栏共用的动作
+        self.create_actions()
+        
         # 创建菜单栏
         self.create_menu_bar()
         
@@ -136,85 +234,73 @@ class EnhancedMainWindow(QMainWindow):
         # 应用样式
         self.apply_styles()
     
+    def create_actions(self):
+        """创建菜单栏和工具栏共用的动作"""
+        # 导出数据（工具栏上显示简短文字）
+        self.act_export = QAction('导出数据', self)
+        self.act_export.setIconText('导出')
+        self.act_export.setShortcut('Ctrl+E')
+        self.act_export.triggered.connect(self.export_data)
+        
+        self.act_exit = QAction('退出', self)
+        self.act_exit.setShortcut('Ctrl+Q')
+        self.act_exit.triggered.connect(self.close)
+        
+        # 弹窗拦截器
+        self.act_popup_blocker = QAction('弹窗拦截器', self)
+        self.act_popup_blocker.setIconText('弹窗拦截')
+        self.act_popup_blocker.triggered.connect(self.show_popup_blocker)
+        
+        # 文件行为分析器
+        self.act_file_behavior = QAction('文件行为分析器', self)
+        self.act_file_behavior.setIconText('文件行为')
+        self.act_file_behavior.triggered.connect(self.show_file_behavior)
+        
+        self.act_refresh = QAction('刷新', self)
+        self.act_refresh.setShortcut('F5')
+        self.act_refresh.triggered.connect(self.refresh_all)
+        
+        self.act_shortcuts = QAction('快捷键', self)
+        self.act_shortcuts.triggered.connect(self.show_shortcuts)
+        
+        self.act_about = QAction('关于', self)
+        self.act_about.triggered.connect(self.show_about)
+    
     def create_menu_bar(self):
         """创建菜单栏"""
         menubar = self.menuBar()
         
         # 文件菜单
         file_menu = menubar.addMenu('文件')
-        
-        export_action = QAction('导出数据', self)
-        export_action.setShortcut('Ctrl+E')
-        export_action.triggered.connect(self.export_data)
-        file_menu.addAction(export_action)
-        
+        file_menu.addAction(self.act_export)
         file_menu.addSeparator()
-        
-        exit_action = QAction('退出', self)
-        exit_action.setShortcut('Ctrl+Q')
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        file_menu.addAction(self.act_exit)
         
         # 工具菜单
         tools_menu = menubar.addMenu('工具')
-        
-        # 弹窗拦截器
-        popup_blocker_action = QAction('弹窗拦截器', self)
-        popup_blocker_action.triggered.connect(self.show_popup_blocker)
-        tools_menu.addAction(popup_blocker_action)
-        
-        # 文件行为分析器
-        file_behavior_action = QAction('文件行为分析器', self)
-        file_behavior_action.triggered.connect(self.show_file_behavior)
-        tools_menu.addAction(file_behavior_action)
+        tools_menu.addAction(self.act_popup_blocker)
+        tools_menu.addAction(self.act_file_behavior)
         
         # 视图菜单
         view_menu = menubar.addMenu('视图')
-        
-        refresh_action = QAction('刷新', self)
-        refresh_action.setShortcut('F5')
-        refresh_action.triggered.connect(self.refresh_all)
-        view_menu.addAction(refresh_action)
+        view_menu.addAction(self.act_refresh)
         
         # 帮助菜单
         help_menu = menubar.addMenu('帮助')
-        
-        shortcuts_action = QAction('快捷键', self)
-        shortcuts_action.triggered.connect(self.show_shortcuts)
-        help_menu.addAction(shortcuts_action)
-        
+        help_menu.addAction(self.act_shortcuts)
         help_menu.addSeparator()
-        
-        about_action = QAction('关于', self)
-        about_action.triggered.connect(self.show_about)
-        help_menu.addAction(about_action)
+        help_menu.addAction(self.act_about)
     
     def create_toolbar(self):
         """创建工具栏"""
         toolbar = self.addToolBar('主工具栏')
         toolbar.setMovable(False)
         
-        # 刷新按钮
-        refresh_action = QAction('刷新', self)
-        refresh_action.triggered.connect(self.refresh_all)
-        toolbar.addAction(refresh_action)
-        
-        # 导出按钮
-        export_action = QAction('导出', self)
-        export_action.triggered.connect(self.export_data)
-        toolbar.addAction(export_action)
-        
+        toolbar.addAction(self.act_refresh)
+        toolbar.addAction(self.act_export)
         toolbar.addSeparator()
-        
-        # 弹窗拦截按钮
-        popup_blocker_action = QAction('弹窗拦截', self)
-        popup_blocker_action.triggered.connect(self.show_popup_blocker)
-        toolbar.addAction(popup_blocker_action)
-        
-        # 文件行为分析按钮
-        file_behavior_action = QAction('文件行为', self)
-        file_behavior_action.triggered.connect(self.show_file_behavior)
-        toolbar.addAction(file_behavior_action)
+        toolbar.addAction(self.act_popup_blocker)
+        toolbar.addAction(self.act_file_behavior)
     
     def create_tabs(self):
         """创建标签页"""
@@ -222,39 +308,66 @@ class EnhancedMainWindow(QMainWindow):
         self.tab_widget.setTabsClosable(False)
         self.tab_widget.setMovable(True)
         
-        # 进程监控标签页
-        self.process_tab = ProcessTab()
-        self.tab_widget.addTab(self.process_tab, "🔄 进程监控")
-        
-        # 网络监控标签页
-        self.network_tab = NetworkTab()
-        self.tab_widget.addTab(self.network_tab, "🌐 网络监控")
-        
-        # 启动项管理标签页
-        self.startup_tab = StartupTab()
-        self.tab_widget.addTab(self.startup_tab, "🚀 启动项管理")
-        
-        # 注册表监控标签页
-        self.registry_tab = RegistryTab()
-        self.tab_widget.addTab(self.registry_tab, "📋 注册表监控")
+        # 先添加空的容器页，标签页控件在首次切换到该页时才创建
+        # 批量添加期间暂停重绘和信号，只做一次布局
+        self.tab_widget.setUpdatesEnabled(False)
+        self.tab_widget.blockSignals(True)
+        for spec in _TAB_SPECS:
+            attr, _, _, title = spec
+            page = QWidget()
+            layout = QVBoxLayout(page)
+            layout.setContentsMargins(0, 0, 0, 0)
+            page._tab_spec = spec
+            page._tab_loaded = False
+            setattr(self, attr, None)
+            self._tab_pages[attr] = page
+            self.tab_widget.addTab(page, title)
+        self.tab_widget.blockSignals(False)
+        self.tab_widget.setUpdatesEnabled(True)
         
-        # 文件监控标签页
-        self.file_monitor_tab = FileMonitorTab()
-        self.tab_widget.addTab(self.file_monitor_tab, "📁 文件监控")
+        self.setCentralWidget(self.tab_widget)
+    
+    def ensure_tab(self, page):
+        """确保容器页中的标签页已创建，首次访问时才导入模块并实例化"""
+        if getattr(page, '_tab_loaded', True):
+            return
+        page._tab_loaded = True
         
-        # 弹窗拦截标签页
-        self.popup_blocker_tab = PopupBlockerTab()
-        self.tab_widget.addTab(self.popup_blocker_tab, "🚫 弹窗拦截")
+        attr, module_name, class_name, _ = page._tab_spec
+        try:
+            tab = _load_tab_class(module_name, class_name)()
+        except Exception as e:
+            # 单个标签页加载失败不影响其他标签页
+            logger.error(f"❌ 标签页 {class_name} 加载失败: {e}")
+            page.layout().addWidget(QLabel(f"{class_name} 加载失败: {e}"))
+            return
         
-        # 模块信息标签页
-        self.modules_tab = ModulesTab()
-        self.tab_widget.addTab(self.modules_tab, "🧩 模块信息")
+        page.setUpdatesEnabled(False)
+        page.layout().addWidget(tab)
+        page.setUpdatesEnabled(True)
+        setattr(self, attr, tab)
         
-        # 沙箱分析标签页
-        self.sandbox_tab = SandboxTab()
-        self.tab_widget.addTab(self.sandbox_tab, "🏖 沙箱分析")
+        # 登记标签页及其刷新入口，并监听显示事件以执行推迟的刷新
+        tab._pending_refresh = False
+        tab.installEventFilter(self)
+        self.tab_widgets[attr] = tab
+        self._refresh_dispatch[attr] = partial(self.refresh_tab, tab)
+    
+    def show_tab(self, attr):
+        """
+        切换到指定标签页（按属性名直接取容器页，不按标题逐个查找）
         
-        self.setCentralWidget(self.tab_widget)
+        Args:
+            attr (str): 标签页属性名
+            
+        Returns:
+            bool: 是否找到该标签页
+        """
+        page = self._tab_pages.get(attr)
+        if page is None:
+            return False
+        self.tab_widget.setCurrentWidget(page)
+        return True
     
     def create_status_bar(self):
         """创建状态栏"""
@@ -264,75 +377,27 @@ class EnhancedMainWindow(QMainWindow):
         self.system_info_label = QLabel()
         self.status_bar.addPermanentWidget(self.system_info_label)
         
-        # 更新系统信息
+        # 系统名称和版本在运行期间不变，只需获取一次并预先生成显示模板
+        system_info = enhanced_system_utils.get_system_info()
+        if 'error' in system_info:
+            self._system_info_format = "CPU: {:.1f}% | 内存: {:.1f}%"
+        else:
+            self._system_info_format = ("CPU: {:.1f}% | 内存: {:.1f}% | "
+                                        f"系统: {system_info['system']} {system_info['release']}")
+        self._last_system_info_values = None
+        
+        # 添加性能信息标签，常驻显示，不占用临时消息区域
+        self.performance_label = QLabel()
+        self.status_bar.addPermanentWidget(self.performance_label)
+        self._last_perf_info = None
+        
+        # 更新系统信息（之后由主定时器定期刷新）
         self.update_system_info()
-        
-        # 设置定时器定期更新系统信息
-        self.system_info_timer = QTimer()
-        self.system_info_timer.timeout.connect(self.update_system_info)
-        self.system_info_timer.start(Config.SYSTEM_INFO_REFRESH_INTERVAL)
     
     def apply_styles(self):
         """应用样式"""
         # 设置整体样式
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            QTabWidget::pane {
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                background-color: #ffffff;
-            }
-            QTabBar::tab {
-                background-color: #e0e0e0;
-                border: 1px solid #cccccc;
-                border-bottom-color: #cccccc;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                min-width: 120px;
-                padding: 8px;
-                margin-right: 2px;
-            }
-            QTabBar::tab:selected {
-                background-color: #ffffff;
-                border-bottom-color: #ffffff;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #f0f0f0;
-            }
-            QToolBar {
-                border: none;
-                background-color: #f8f8f8;
-                spacing: 8px;
-                padding: 4px;
-            }
-            QMenuBar {
-                background-color: #2d2d2d;
-                color: white;
-            }
-            QMenuBar::item {
-                background-color: transparent;
-                padding: 4px 8px;
-            }
-            QMenuBar::item:selected {
-                background-color: #3d3d3d;
-            }
-            QMenuBar::item:pressed {
-                background-color: #4d4d4d;
-            }
-            QMenu {
-                background-color: #f8f8f8;
-                border: 1px solid #cccccc;
-            }
-            QMenu::item {
-                padding: 4px 20px;
-            }
-            QMenu::item:selected {
-                background-color: #4a90e2;
-                color: white;
-            }
-        """)
+        self.setStyleSheet(_MAIN_STYLESHEET)
     
     def init_first_tab(self):
         """初始化第一个标签页"""
@@ -343,60 +408,100 @@ class EnhancedMainWindow(QMainWindow):
         """标签页切换事件处理"""
         if index >= 0 and index < self.tab_widget.count():
             self.current_tab_index = index
-            tab_text = self.tab_widget.tabText(index)
-            logger.info(f"切换到标签页: {tab_text}")
+            # 仅在INFO日志启用时才读取标签文字和格式化日志
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("切换到标签页: %s", self.tab_widget.tabText(index))
+            
+            # 首次切换到该标签页时创建控件；按容器页识别标签页，不受拖动排序影响
+            page = self.tab_widget.widget(index)
+            self.ensure_tab(page)
+            attr = page._tab_spec[0]
             
             # 延迟初始化标签页内容
-            if self.enable_delayed_init and index not in self.initialized_tabs:
-                QTimer.singleShot(self.delayed_init_delay, lambda: self.init_tab_content(index))
+            if self.enable_delayed_init and attr not in self.initialized_tabs:
+                self._deferred_attr = attr
+                self._deferred_init_timer.start(self.delayed_init_delay)
+    
+    def _do_deferred_init(self):
+        """延迟初始化定时器到期，初始化最近一次请求的标签页"""
+        self.init_tab_content(self._deferred_attr)
     
-    def init_tab_content(self, index):
+    def init_tab_content(self, attr):
         """初始化标签页内容"""
-        if index in self.initialized_tabs:
+        if attr in self.initialized_tabs:
             return
         
         try:
-            # 根据标签页索引初始化对应的内容
-            if index == 0:  # 进程监控
-                self.process_tab.refresh()
-            elif index == 1:  # 网络监控
-                self.network_tab.refresh()
-            elif index == 2:  # 启动项管理
-                self.startup_tab.refresh()
-            elif index == 3:  # 注册表监控
-                self.registry_tab.refresh()
-            elif index == 4:  # 文件监控
-                self.file_monitor_tab.refresh()
-            elif index == 5:  # 弹窗拦截
-                self.popup_blocker_tab.refresh()
-            elif index == 6:  # 模块信息
-                self.modules_tab.refresh()
-            elif index == 7:  # 沙箱分析
-                self.sandbox_tab.refresh()
+            # 根据标签页属性名查表初始化对应的内容
+            refresh = self._refresh_dispatch.get(attr)
+            if refresh:
+                refresh()
             
-            self.initialized_tabs.add(index)
-            logger.info(f"标签页 {index} 初始化完成")
+            self.initialized_tabs.add(attr)
+            logger.info("标签页 %s 初始化完成", attr)
         except Exception as e:
-            logger.error(f"初始化标签页 {index} 时出错: {e}")
+            logger.error(f"初始化标签页 {attr} 时出错: {e}")
+    
+    def refresh_tab(self, tab):
+        """刷新标签页，不可见的标签页推迟到下次显示时再刷新"""
+        if tab.isVisible():
+            tab._pending_refresh = False
+            self.start_tab_refresh(tab)
+        else:
+            tab._pending_refresh = True
+    
+    def start_tab_refresh(self, tab):
+        """
+        执行标签页刷新
+        
+        统一调用标签页自身的refresh，由标签页负责防抖和后台线程；
+        标签页启动了后台刷新线程时，记录该线程以便全部刷新完成后提示
+        """
+        tab.refresh()
+        
+        worker = getattr(tab, 'refresh_worker', None)
+        if tab not in self._refresh_workers and worker is not None and worker.isRunning():
+            worker.finished.connect(partial(self.on_tab_refresh_finished, tab))
+            self._refresh_workers[tab] = worker
+    
+    def on_tab_refresh_finished(self, tab):
+        """标签页后台刷新线程结束回调"""
+        self._refresh_workers.pop(tab, None)
+        if self._refresh_all_pending and not self._refresh_workers:
+            self.on_refresh_all_finished()
+    
+    def eventFilter(self, obj, event):
+        """标签页显示时执行推迟的刷新"""
+        if event.type() == QEvent.Show and getattr(obj, '_pending_refresh', False):
+            obj._pending_refresh = False
+            try:
+                self.start_tab_refresh(obj)
+            except Exception as e:
+                logger.error(f"刷新标签页时出错: {e}")
+        return super().eventFilter(obj, event)
     
     def refresh_all(self):
         """刷新所有标签页"""
         try:
-            self.process_tab.refresh()
-            self.network_tab.refresh()
-            self.startup_tab.refresh()
-            self.registry_tab.refresh()
-            self.file_monitor_tab.refresh()
-            self.popup_blocker_tab.refresh()
-            self.modules_tab.refresh()
-            self.sandbox_tab.refresh()
+            self._refresh_all_pending = True
+            for tab in self.tab_widgets.values():
+                self.refresh_tab(tab)
             self.update_system_info()
-            logger.info("所有标签页刷新完成")
-            self.statusBar().showMessage("刷新完成", 3000)
+            
+            # 没有后台刷新任务时立即完成，否则等待最后一个后台线程结束
+            if not self._refresh_workers:
+                self.on_refresh_all_finished()
         except Exception as e:
+            self._refresh_all_pending = False
             logger.error(f"刷新失败: {e}")
             show_error_message(self, "错误", f"刷新失败: {e}")
     
+    def on_refresh_all_finished(self):
+        """所有标签页刷新完成"""
+        self._refresh_all_pending = False
+        logger.info("所有标签页刷新完成")
+        self.statusBar().showMessage("刷新完成", 3000)
+    
     def export_data(self):
         """导出数据"""
         try:
@@ -411,7 +516,7 @@ class EnhancedMainWindow(QMainWindow):
         """显示弹窗拦截器"""
         try:
             # 切换到弹窗拦截标签页
-            self.tab_widget.setCurrentWidget(self.popup_blocker_tab)
+            self.show_tab('popup_blocker_tab')
             logger.info("显示弹窗拦截器")
         except Exception as e:
             logger.error(f"显示弹窗拦截器时出错: {e}")
@@ -421,7 +526,7 @@ class EnhancedMainWindow(QMainWindow):
         """显示文件行为分析器"""
         try:
             # 切换到文件监控标签页
-            self.tab_widget.setCurrentWidget(self.file_monitor_tab)
+            self.show_tab('file_monitor_tab')
             logger.info("显示文件行为分析器")
         except Exception as e:
             logger.error(f"显示文件行为分析器时出错: {e}")
@@ -456,70 +561,125 @@ Ctrl+Q - 退出程序
         except Exception as e:
             logger.error(f"显示关于对话框时出错: {e}")
     
+    def _on_master_tick(self):
+        """主定时器节拍，按计数分发各项定时任务"""
+        self._tick += 1
+        self.monitor_performance()
+        if self._tick % _SYSTEM_INFO_TICKS == 0:
+            self.update_system_info()
+        if self.enable_memory_cleanup and self._tick % _MEMORY_CLEANUP_TICKS == 0:
+            self.cleanup_memory()
+    
+    @safe_slot()
     def update_system_info(self):
         """更新系统信息显示"""
-        try:
-            system_info = enhanced_system_utils.get_system_info()
-            cpu_info = enhanced_system_utils.get_cpu_info()
-            memory_info = enhanced_system_utils.get_memory_info()
-            
-            if 'error' not in system_info and 'error' not in cpu_info and 'error' not in memory_info:
-                info_text = f"CPU: {cpu_info['usage_percent']:.1f}% | " \
-                           f"内存: {memory_info['percent']:.1f}% | " \
-                           f"系统: {system_info['system']} {system_info['release']}"
-                self.system_info_label.setText(info_text)
-        except Exception as e:
-            logger.error(f"更新系统信息时出错: {e}")
+        cpu_info = enhanced_system_utils.get_cpu_info()
+        memory_info = enhanced_system_utils.get_memory_info()
+        
+        if 'error' not in cpu_info and 'error' not in memory_info:
+            # 按显示精度比较，数值未变化时不重设文本，避免无谓的重绘
+            values = (round(cpu_info['usage_percent'], 1), round(memory_info['percent'], 1))
+            if values != self._last_system_info_values:
+                self._last_system_info_values = values
+                self.system_info_label.setText(self._system_info_format.format(*values))
     
+    @safe_slot()
     def cleanup_memory(self):
         """清理内存，释放不需要的资源"""
-        try:
-            enhanced_system_utils.optimize_system_performance()
-            logger.debug("内存清理完成")
-        except Exception as e:
-            logger.error(f"内存清理时出错: {e}")
+        # 上一次的资源采样尚未完成时跳过，避免任务堆积
+        if self._cleanup_worker is not None and self._cleanup_worker.isRunning():
+            return
+        
+        # 垃圾回收可能析构Qt对象，必须留在GUI线程执行；按次数轮换回收代数，避免每次都完整回收
+        self._cleanup_count += 1
+        if self._cleanup_count % _GC_FULL_CLEANUPS == 0:
+            generation = 2
+        elif self._cleanup_count % _GC_GEN1_CLEANUPS == 0:
+            generation = 1
+        else:
+            generation = 0
+        # 自上次回收以来新分配的对象很少时跳过，空闲时不占用界面线程
+        count0, count1, _ = gc.get_count()
+        if generation == 2 or count0 >= _GC_MIN_GEN0 or count1 >= _GC_MIN_GEN1:
+            enhanced_system_utils.resource_manager.collect_garbage(generation)
+        
+        # 资源采样包含阻塞等待，放到后台线程执行
+        self._cleanup_worker = ResourceSampleWorker(self)
+        self._cleanup_worker.sample_finished.connect(self.on_cleanup_finished)
+        self._cleanup_worker.finished.connect(self.on_cleanup_thread_finished)
+        self._cleanup_worker.finished.connect(self._cleanup_worker.deleteLater)
+        self._cleanup_worker.start()
+    
+    def on_cleanup_finished(self):
+        """后台资源采样完成回调"""
+        logger.debug("内存清理完成")
     
+    def on_cleanup_thread_finished(self):
+        """后台资源采样线程结束回调，丢弃对即将释放的线程对象的引用"""
+        if self.sender() is self._cleanup_worker:
+            self._cleanup_worker = None
+    
+    @safe_slot()
     def monitor_performance(self):
         """监控系统性能"""
-        try:
-            # 记录当前资源使用情况
-            enhanced_system_utils.resource_manager.log_resource_usage()
-            
-            # 获取当前资源使用情况
-            memory_usage = enhanced_system_utils.resource_manager.get_memory_usage()
-            cpu_usage = enhanced_system_utils.resource_manager.get_cpu_usage()
-            
-            if 'error' not in memory_usage and 'error' not in cpu_usage:
-                # 在状态栏显示简要信息
-                perf_info = f"内存: {memory_usage['percent']:.1f}% | CPU: {cpu_usage['percent']:.1f}%"
-                self.statusBar().showMessage(perf_info, 2000)
-        except Exception as e:
-            logger.error(f"性能监控时出错: {e}")
+        # 获取当前资源使用情况，采样一次同时用于记录和显示
+        resource_manager = enhanced_system_utils.resource_manager
+        memory_usage = resource_manager.get_memory_usage()
+        cpu_usage = resource_manager.get_cpu_usage()
+        resource_manager.log_resource_usage(memory_usage, cpu_usage)
+        
+        if 'error' not in memory_usage and 'error' not in cpu_usage:
+            # 在状态栏显示简要信息
+            # 对采样值做指数平滑，减少读数抖动引起的频繁刷新
+            if self._cpu_ema is None:
+                self._cpu_ema = cpu_usage['percent']
+                self._mem_ema = memory_usage['percent']
+            else:
+                self._cpu_ema = _ema(self._cpu_ema, cpu_usage['percent'], _PERF_EMA_ALPHA)
+                self._mem_ema = _ema(self._mem_ema, memory_usage['percent'], _PERF_EMA_ALPHA)
+            perf_info = f"内存: {self._mem_ema:.1f}% | CPU: {self._cpu_ema:.1f}%"
+            # 与上次显示的内容相同时不重设文本，避免无谓的重绘
+            if perf_info != self._last_perf_info:
+                self._last_perf_info = perf_info
+                self.performance_label.setText(perf_info)
     
     def closeEvent(self, event):
         """窗口关闭事件"""
         try:
             # 停止所有定时器
-            if hasattr(self, 'memory_cleanup_timer'):
-                self.memory_cleanup_timer.stop()
+            if hasattr(self, '_master_timer'):
+                self._master_timer.stop()
+            self._deferred_init_timer.stop()
             
-            if hasattr(self, 'system_info_timer'):
-                self.system_info_timer.stop()
+            # 等待后台资源采样线程结束
+            if self._cleanup_worker is not None and self._cleanup_worker.isRunning():
+                self._cleanup_worker.wait()
             
-            if hasattr(self, 'performance_monitor_timer'):
-                self.performance_monitor_timer.stop()
+            # 等待后台刷新线程结束
+            for worker in list(self._refresh_workers.values()):
+                worker.wait()
+            self._refresh_workers.clear()
             
-            # 清理所有标签页资源
-            tabs = [self.process_tab, self.network_tab, self.startup_tab, 
-                   self.registry_tab, self.file_monitor_tab, self.popup_blocker_tab,
-                   self.modules_tab, self.sandbox_tab]
+            # 断开标签页切换信号，避免销毁过程中触发切换处理
+            self.tab_widget.currentChanged.disconnect(self.on_tab_changed)
             
-            for tab in tabs:
-                if hasattr(tab, 'cleanup'):
-                    try:
+            # 清理所有已创建标签页的资源，并尽快释放对应的Qt对象
+            for tab in self.tab_widgets.values():
+                try:
+                    if hasattr(tab, 'cleanup'):
                         tab.cleanup()
-                    except Exception as e:
-                        logger.error(f"清理标签页资源时出错: {e}")
+                except Exception as e:
+                    logger.error(f"清理标签页资源时出错: {e}")
+                finally:
+                    tab.removeEventFilter(self)
+                    tab.setParent(None)
+                    tab.deleteLater()
+            
+            for attr in self._tab_pages:
+                setattr(self, attr, None)
+            self.tab_widgets.clear()
+            self._refresh_dispatch.clear()
+            self.initialized_tabs.clear()
             
             logger.info("主窗口关闭，资源清理完成")
             event.accept()
@@ -5,27 +5,194 @@
 """
 import logging
 import os
+import re
 import time
 import json
+from collections import Counter, namedtuple
+from functools import lru_cache
 from datetime import datetime
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QTableWidget, QTableWidgetItem, QLabel, QMessageBox, 
+                             QTableView, QLabel, QMessageBox, QHeaderView,
                              QAbstractItemView, QGroupBox, QFormLayout, QLineEdit,
                              QTextEdit, QFileDialog, QProgressBar, QComboBox,
                              QSplitter)
-from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
+from PyQt5.QtCore import (QTimer, Qt, QThread, pyqtSignal, QAbstractTableModel,
+                          QModelIndex, QSortFilterProxyModel)
 from utils.system_utils import SystemUtils, performance_monitor
 
+# 尝试导入pandas用于大批量事件的向量化统计
+try:
+    import pandas as pd
+    PANDAS_AVAILABLE = True
+except ImportError:
+    PANDAS_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# 事件数超过该值且pandas可用时使用向量化统计
+_VECTORIZE_THRESHOLD = 10000
+
+# 临时目录路径匹配（忽略大小写）
+_TEMP_RE = re.compile(r'(?:temp\\|tmp\\|appdata\\local\\temp)', re.IGNORECASE)
+
+class FileEvent(namedtuple('FileEvent', 'time operation path process details type timestamp')):
+    """
+    过滤后的文件事件记录
+    字段通过属性访问，同时保留字典式的get接口供统计格式化和表格模型使用
+    """
+    __slots__ = ()
+    
+    def get(self, key, default=None):
+        if key in self._fields:
+            return getattr(self, key)
+        return default
+
+
+# 常见事件类型的显示名称
+_OPERATION_NAMES = {
+    'create': 'Create',
+    'modify': 'Modify',
+    'delete': 'Delete',
+    'access': 'Access',
+}
+
+# 事件类型到统计项的映射
+_TYPE_BUCKETS = {
+    'create': 'create_operations',
+    'modify': 'modify_operations',
+    'delete': 'delete_operations',
+}
+
+
+@lru_cache(maxsize=None)
+def _type_bucket(event_type):
+    """
+    返回事件类型对应的统计项，无对应统计项时返回None
+    优先精确匹配，带前后缀的类型（如file_create）退回子串匹配，结果按类型缓存
+    """
+    event_type = event_type.lower()
+    bucket = _TYPE_BUCKETS.get(event_type)
+    if bucket is None:
+        bucket = next((v for k, v in _TYPE_BUCKETS.items() if k in event_type), None)
+    return bucket
+
+
+# 分析线程每批发送给界面的事件数
+_ANALYSIS_CHUNK_SIZE = 1000
+
+# 分析时间范围选项（分钟）
+_TIME_RANGES = {
+    "最近5分钟": 5,
+    "最近10分钟": 10,
+    "最近30分钟": 30,
+    "最近1小时": 60,
+    "最近2小时": 120,
+    "最近24小时": 1440
+}
+
+# 结果表格的列定义：(表头, 文件操作记录中的字段名)
+_RESULT_COLUMNS = (
+    ('时间', 'time'),
+    ('操作类型', 'operation'),
+    ('文件路径', 'path'),
+    ('进程', 'process'),
+    ('详细信息', 'details'),
+    ('风险等级', 'risk_level'),
+)
+_RESULT_HEADERS = tuple(header for header, _ in _RESULT_COLUMNS)
+
+
+class FileOpsModel(QAbstractTableModel):
+    """
+    文件操作记录表格模型
+    直接包装分析结果中的文件操作列表，视图只查询可见行的数据
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._headers = _RESULT_HEADERS
+        self._cols = tuple(key for _, key in _RESULT_COLUMNS)
+    
+    def set_rows(self, rows):
+        """替换全部文件操作记录"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+    
+    def append_rows(self, rows):
+        """在末尾追加一批文件操作记录"""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+    
+    def rows(self):
+        """返回当前的文件操作记录"""
+        return self._rows
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._cols)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        # 只响应显示角色，其余角色直接返回None
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._rows[index.row()].get(self._cols[index.column()], '')
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+
+class FileOpsFilterProxy(QSortFilterProxyModel):
+    """
+    文件操作记录过滤代理
+    按事件时间戳过滤已缓存的分析结果，并提供表头排序
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._min_timestamp = None
+    
+    def set_min_timestamp(self, min_timestamp):
+        """设置最早的事件时间戳，None表示不过滤"""
+        self._min_timestamp = min_timestamp
+        self.invalidateFilter()
+    
+    def filterAcceptsRow(self, source_row, source_parent):
+        if self._min_timestamp is None:
+            return True
+        row = self.sourceModel().rows()[source_row]
+        return row.get('timestamp', 0) >= self._min_timestamp
+
 
 class FileBehaviorAnalyzer(QWidget):
     """系统文件行为分析器"""
     
+    # 转发当前分析线程的结果，外部可在线程启动前连接
+    analysis_finished = pyqtSignal(dict)
+    analysis_error = pyqtSignal(str)
+    analysis_stopped = pyqtSignal()  # 当前分析线程已结束
+    
     def __init__(self):
         super().__init__()
         self.analyze_worker = None
         self.last_analysis_results = None
+        self._analysis_minutes = 0       # 已缓存结果覆盖的时间范围（分钟）
+        self._analysis_started = 0       # 已缓存结果的分析开始时间
         self.auto_analysis_timer = QTimer()
         self.auto_analysis_timer.timeout.connect(self.start_analysis)
         self.init_ui()
@@ -48,6 +215,7 @@ class FileBehaviorAnalyzer(QWidget):
         self.time_range_combo = QComboBox()
         self.time_range_combo.addItems(["最近5分钟", "最近10分钟", "最近30分钟", "最近1小时", "最近2小时", "最近24小时"])
         self.time_range_combo.setCurrentText("最近10分钟")
+        self.time_range_combo.currentTextChanged.connect(self.on_time_range_changed)
         control_layout_group.addRow("分析时间范围:", self.time_range_combo)
         
         # 控制按钮
@@ -85,13 +253,25 @@ class FileBehaviorAnalyzer(QWidget):
         results_layout.addWidget(stats_group)
         
         # 分析结果表格
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(6)
-        self.result_table.setHorizontalHeaderLabels(['时间', '操作类型', '文件路径', '进程', '详细信息', '风险等级'])
+        self.result_model = FileOpsModel(self)
+        self.result_proxy = FileOpsFilterProxy(self)
+        self.result_proxy.setSourceModel(self.result_model)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_proxy)
         self.result_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.result_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.result_table.setAlternatingRowColors(True)
         self.result_table.setSortingEnabled(True)
         self.result_table.setWordWrap(False)
+        
+        # 使用固定列宽，避免每次显示结果时按内容计算列宽
+        self.result_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.result_table.horizontalHeader().setStretchLastSection(True)
+        self.result_table.setColumnWidth(0, 150)  # 时间
+        self.result_table.setColumnWidth(1, 80)   # 操作类型
+        self.result_table.setColumnWidth(2, 300)  # 文件路径
+        self.result_table.setColumnWidth(3, 120)  # 进程
+        self.result_table.setColumnWidth(4, 120)  # 详细信息
         results_layout.addWidget(self.result_table)
         
         # 添加到分割器
@@ -105,19 +285,13 @@ class FileBehaviorAnalyzer(QWidget):
     def start_analysis(self):
         """
         开始分析系统文件行为
+        
+        Returns:
+            bool: 分析线程是否已启动
         """
         try:
             # 获取分析时间范围（分钟）
-            time_range_text = self.time_range_combo.currentText()
-            time_ranges = {
-                "最近5分钟": 5,
-                "最近10分钟": 10,
-                "最近30分钟": 30,
-                "最近1小时": 60,
-                "最近2小时": 120,
-                "最近24小时": 1440
-            }
-            minutes = time_ranges.get(time_range_text, 10)
+            minutes = _TIME_RANGES.get(self.time_range_combo.currentText(), 10)
             
             # 禁用开始按钮，显示进度条
             self.start_analyze_btn.setEnabled(False)
@@ -126,22 +300,44 @@ class FileBehaviorAnalyzer(QWidget):
             self.progress_bar.setRange(0, 0)  # 设置为不确定模式
             
             # 清空之前的结果
-            self.result_table.setRowCount(0)
+            self.result_model.set_rows([])
+            self.result_proxy.set_min_timestamp(None)
             self.stats_text.clear()
+            self._analysis_minutes = minutes
+            self._analysis_started = time.time()
             
             # 启动分析工作线程
             self.analyze_worker = FileAnalyzeWorker(minutes)
+            self.analyze_worker.chunk_ready.connect(self.on_analysis_chunk)
             self.analyze_worker.analysis_finished.connect(self.on_analysis_finished)
             self.analyze_worker.analysis_error.connect(self.on_analysis_error)
+            self.analyze_worker.finished.connect(self.on_analysis_thread_finished)
             self.analyze_worker.start()
             
             logger.info(f"开始分析系统文件行为，时间范围: {minutes}分钟")
+            return True
             
         except Exception as e:
             logger.error(f"启动系统文件行为分析时出错: {e}", exc_info=True)
             QMessageBox.critical(self, "错误", f"启动系统文件行为分析时出错: {e}")
             self.start_analyze_btn.setEnabled(True)
             self.progress_bar.setVisible(False)
+            return False
+    
+    def on_analysis_thread_finished(self):
+        """
+        分析线程结束回调，只转发当前分析线程的结束通知
+        """
+        if self.sender() is self.analyze_worker:
+            self.analysis_stopped.emit()
+    
+    def on_analysis_chunk(self, chunk):
+        """
+        分析结果分批到达回调
+        """
+        # 忽略已被新分析替换的旧线程发来的数据
+        if self.sender() is self.analyze_worker:
+            self.result_model.append_rows(chunk)
     
     def on_analysis_finished(self, results):
         """
@@ -156,18 +352,50 @@ class FileBehaviorAnalyzer(QWidget):
             # 保存结果供导出使用
             self.last_analysis_results = results
             
-            # 显示统计信息
+            # 显示统计信息，详细结果已在分析过程中按批加入表格
             stats_info = results.get('statistics', {})
             stats_text = self.format_statistics(stats_info)
             self.stats_text.setPlainText(stats_text)
             
-            # 显示详细结果
-            self.display_results(results)
-            
             logger.info("系统文件行为分析完成")
+            self.analysis_finished.emit(results)
         except Exception as e:
             logger.error(f"处理分析结果时出错: {e}", exc_info=True)
             QMessageBox.critical(self, "错误", f"处理分析结果时出错: {e}")
+            self.analysis_error.emit(str(e))
+    
+    def on_time_range_changed(self, time_range_text):
+        """
+        时间范围变化回调
+        已缓存的结果覆盖新的时间范围时直接过滤表格，无需重新分析
+        """
+        try:
+            minutes = _TIME_RANGES.get(time_range_text, 10)
+            if not self.last_analysis_results or (self.analyze_worker and self.analyze_worker.isRunning()):
+                return
+            
+            if minutes > self._analysis_minutes:
+                # 新范围超出已缓存结果：取消过滤，显示完整结果的统计并提示重新分析
+                self.result_proxy.set_min_timestamp(None)
+                stats_text = self.format_statistics(self.last_analysis_results.get('statistics', {}))
+                self.stats_text.setPlainText(
+                    f"{stats_text}\n\n当前结果仅覆盖最近{self._analysis_minutes}分钟，"
+                    f"请重新开始分析以查看{time_range_text}的文件行为")
+                return
+            
+            min_timestamp = self._analysis_started - minutes * 60
+            self.result_proxy.set_min_timestamp(min_timestamp)
+            
+            # 按新的时间范围重新统计已缓存的事件
+            events = [row for row in self.result_model.rows()
+                      if row.get('timestamp', 0) >= min_timestamp]
+            statistics = self.analyze_worker.analyze_statistics(events)
+            statistics['time_range'] = f"最近{minutes}分钟"
+            self.stats_text.setPlainText(self.format_statistics(statistics))
+            
+            logger.info(f"使用已缓存的分析结果过滤到最近{minutes}分钟")
+        except Exception as e:
+            logger.error(f"按时间范围过滤分析结果时出错: {e}", exc_info=True)
     
     def on_analysis_error(self, error_msg):
         """
@@ -180,44 +408,25 @@ class FileBehaviorAnalyzer(QWidget):
         
         logger.error(f"系统文件行为分析出错: {error_msg}")
         QMessageBox.critical(self, "错误", f"系统文件行为分析出错:\n{error_msg}")
+        self.analysis_error.emit(error_msg)
     
     def display_results(self, results):
         """
         显示分析结果
         """
         try:
-            # 显示文件操作记录
+            # 显示文件操作记录，表格视图按需读取可见行
             file_operations = results.get('file_operations', [])
-            self.result_table.setRowCount(len(file_operations))
-            
-            for i, operation in enumerate(file_operations):
-                # 时间
-                time_item = QTableWidgetItem(operation.get('time', ''))
-                time_item.setFlags(time_item.flags() & ~Qt.ItemIsEditable)
-                self.result_table.setItem(i, 0, time_item)
-                
-                # 操作类型
-                operation_item = QTableWidgetItem(operation.get('operation', ''))
-                operation_item.setFlags(operation_item.flags() & ~Qt.ItemIsEditable)
-                self.result_table.setItem(i, 1, operation_item)
-                
-                # 文件路径
-                path_item = QTableWidgetItem(operation.get('path', ''))
-                path_item.setFlags(path_item.flags() & ~Qt.ItemIsEditable)
-                self.result_table.setItem(i, 2, path_item)
-                
-                # 进程
-                process_item = QTableWidgetItem(operation.get('process', ''))
-                process_item.setFlags(process_item.flags() & ~Qt.ItemIsEditable)
-                self.result_table.setItem(i, 3, process_item)
-                
-                # 详细信息
-                details_item = QTableWidgetItem(operation.get('details', ''))
-                details_item.setFlags(details_item.flags() & ~Qt.ItemIsEditable)
-                self.result_table.setItem(i, 4, details_item)
             
-            # 调整列宽
-            self.result_table.resizeColumnsToContents()
+            # 批量替换数据期间暂停排序和重绘，并清除排序指示，避免重新启用排序时隐式排序
+            self.result_table.setSortingEnabled(False)
+            self.result_table.setUpdatesEnabled(False)
+            try:
+                self.result_model.set_rows(file_operations)
+                self.result_table.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+            finally:
+                self.result_table.setSortingEnabled(True)
+                self.result_table.setUpdatesEnabled(True)
             
             # 显示统计信息
             stats_info = results.get('statistics', {})
@@ -230,132 +439,132 @@ class FileBehaviorAnalyzer(QWidget):
     
     def format_statistics(self, stats_info):
         """
-        格式化统计信息
+        格式化统计信息（各段先收集到列表，最后一次拼接）
         """
         try:
             analysis_type = stats_info.get('analysis_type', '基础')
-            stats_text = f"系统文件行为分析统计报告 ({analysis_type}分析)\n"
-            stats_text += "=" * 50 + "\n"
-            stats_text += f"分析时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-            stats_text += f"时间范围: {stats_info.get('time_range', '未知')}\n\n"
+            parts = [f"系统文件行为分析统计报告 ({analysis_type}分析)\n"]
+            parts.append("=" * 50 + "\n")
+            parts.append(f"分析时间: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            parts.append(f"时间范围: {stats_info.get('time_range', '未知')}\n\n")
             
             # 基本统计
-            stats_text += "基本统计信息:\n"
-            stats_text += f"  总操作数: {stats_info.get('total_operations', 0)}\n"
-            stats_text += f"  创建文件操作数: {stats_info.get('create_operations', 0)}\n"
-            stats_text += f"  修改文件操作数: {stats_info.get('modify_operations', 0)}\n"
-            stats_text += f"  删除文件操作数: {stats_info.get('delete_operations', 0)}\n\n"
+            parts.append("基本统计信息:\n")
+            parts.append(f"  总操作数: {stats_info.get('total_operations', 0)}\n")
+            parts.append(f"  创建文件操作数: {stats_info.get('create_operations', 0)}\n")
+            parts.append(f"  修改文件操作数: {stats_info.get('modify_operations', 0)}\n")
+            parts.append(f"  删除文件操作数: {stats_info.get('delete_operations', 0)}\n\n")
             
             # 进程统计
             process_stats = stats_info.get('process_statistics', {})
             if process_stats:
-                stats_text += "进程操作统计 (前10个):\n"
+                parts.append("进程操作统计 (前10个):\n")
                 # 按操作次数排序
                 sorted_processes = sorted(process_stats.items(), key=lambda x: x[1], reverse=True)
                 for process, count in sorted_processes[:10]:
-                    stats_text += f"  {process}: {count} 次操作\n"
-                stats_text += "\n"
+                    parts.append(f"  {process}: {count} 次操作\n")
+                parts.append("\n")
             
             # 目录统计
             directory_stats = stats_info.get('directory_statistics', {})
             if directory_stats:
-                stats_text += "目录操作统计 (前10个):\n"
+                parts.append("目录操作统计 (前10个):\n")
                 # 按操作次数排序
                 sorted_directories = sorted(directory_stats.items(), key=lambda x: x[1], reverse=True)
                 for directory, count in sorted_directories[:10]:
-                    stats_text += f"  {directory}: {count} 次操作\n"
-                stats_text += "\n"
+                    parts.append(f"  {directory}: {count} 次操作\n")
+                parts.append("\n")
             
             # 可疑行为
             suspicious_operations = stats_info.get('suspicious_operations', [])
             if suspicious_operations:
-                stats_text += "可疑行为检测:\n"
+                parts.append("可疑行为检测:\n")
                 for operation in suspicious_operations[:10]:  # 只显示前10个
-                    stats_text += f"  [{operation.get('time', '')}] {operation.get('process', '')} {operation.get('operation', '')} {operation.get('path', '')}\n"
+                    parts.append(f"  [{operation.get('time', '')}] {operation.get('process', '')} {operation.get('operation', '')} {operation.get('path', '')}\n")
                 
                 if len(suspicious_operations) > 10:
-                    stats_text += f"  ... 还有 {len(suspicious_operations) - 10} 个可疑操作\n"
-                stats_text += "\n"
+                    parts.append(f"  ... 还有 {len(suspicious_operations) - 10} 个可疑操作\n")
+                parts.append("\n")
             
             # 临时目录操作
             temp_operations = stats_info.get('temp_dir_operations', [])
             if temp_operations:
-                stats_text += "临时目录操作:\n"
+                parts.append("临时目录操作:\n")
                 for operation in temp_operations[:10]:  # 只显示前10个
-                    stats_text += f"  [{operation.get('time', '')}] {operation.get('process', '')} {operation.get('operation', '')} {operation.get('path', '')}\n"
+                    parts.append(f"  [{operation.get('time', '')}] {operation.get('process', '')} {operation.get('operation', '')} {operation.get('path', '')}\n")
                 
                 if len(temp_operations) > 10:
-                    stats_text += f"  ... 还有 {len(temp_operations) - 10} 个临时目录操作\n"
-                stats_text += "\n"
+                    parts.append(f"  ... 还有 {len(temp_operations) - 10} 个临时目录操作\n")
+                parts.append("\n")
             
             # 文件类型统计
             file_type_stats = stats_info.get('file_type_statistics', {})
             if file_type_stats:
-                stats_text += "文件类型统计 (前10个):\n"
+                parts.append("文件类型统计 (前10个):\n")
                 sorted_file_types = sorted(file_type_stats.items(), key=lambda x: x[1], reverse=True)
                 for file_type, count in sorted_file_types[:10]:
-                    stats_text += f"  {file_type}: {count} 次操作\n"
-                stats_text += "\n"
+                    parts.append(f"  {file_type}: {count} 次操作\n")
+                parts.append("\n")
             
             # 高频操作文件
             frequent_files = stats_info.get('frequent_files', [])
             if frequent_files:
-                stats_text += "高频操作文件 (前10个):\n"
+                parts.append("高频操作文件 (前10个):\n")
                 for file_info in frequent_files[:10]:
-                    stats_text += f"  {file_info['path']}: {file_info['count']} 次操作\n"
-                stats_text += "\n"
+                    parts.append(f"  {file_info['path']}: {file_info['count']} 次操作\n")
+                parts.append("\n")
             
             # 高级分析特有的统计信息
             if analysis_type == "高级":
                 # 按时间分布统计
                 time_distribution = stats_info.get('time_distribution', {})
                 if time_distribution:
-                    stats_text += "时间分布统计:\n"
+                    parts.append("时间分布统计:\n")
                     for hour, count in sorted(time_distribution.items()):
-                        stats_text += f"  {hour}:00 - {hour+1}:00  {count} 次操作\n"
-                    stats_text += "\n"
+                        parts.append(f"  {hour}:00 - {hour+1}:00  {count} 次操作\n")
+                    parts.append("\n")
                 
                 # 异常行为统计
                 anomaly_stats = stats_info.get('anomaly_statistics', {})
                 if anomaly_stats:
-                    stats_text += "异常行为统计:\n"
+                    parts.append("异常行为统计:\n")
                     for anomaly_type, count in anomaly_stats.items():
-                        stats_text += f"  {anomaly_type}: {count} 次\n"
-                    stats_text += "\n"
+                        parts.append(f"  {anomaly_type}: {count} 次\n")
+                    parts.append("\n")
                 
                 # 进程行为模式分析
                 process_behavior = stats_info.get('process_behavior_patterns', {})
                 if process_behavior:
-                    stats_text += "进程行为模式分析:\n"
+                    parts.append("进程行为模式分析:\n")
                     for process, behaviors in list(process_behavior.items())[:5]:  # 仅显示前5个进程
-                        stats_text += f"  {process}:\n"
+                        parts.append(f"  {process}:\n")
                         for behavior, count in list(behaviors.items())[:3]:  # 仅显示前3种行为
-                            stats_text += f"    {behavior}: {count} 次\n"
-                    stats_text += "\n"
+                            parts.append(f"    {behavior}: {count} 次\n")
+                    parts.append("\n")
             # 基础分析的统计信息格式化
             else:
                 # 可疑行为检测
                 suspicious_operations = stats_info.get('suspicious_operations', [])
                 if suspicious_operations:
-                    stats_text += "可疑行为检测:\n"
+                    parts.append("可疑行为检测:\n")
                     for operation in suspicious_operations[:10]:  # 只显示前10个
-                        stats_text += f"  [{operation.get('time', '')}] {operation.get('process', '')} {operation.get('operation', '')} {operation.get('path', '')}\n"
+                        parts.append(f"  [{operation.get('time', '')}] {operation.get('process', '')} {operation.get('operation', '')} {operation.get('path', '')}\n")
                     
                     if len(suspicious_operations) > 10:
-                        stats_text += f"  ... 还有 {len(suspicious_operations) - 10} 个可疑操作\n"
-                    stats_text += "\n"
+                        parts.append(f"  ... 还有 {len(suspicious_operations) - 10} 个可疑操作\n")
+                    parts.append("\n")
                 
                 # 临时目录操作
                 temp_operations = stats_info.get('temp_dir_operations', [])
                 if temp_operations:
-                    stats_text += "临时目录操作:\n"
+                    parts.append("临时目录操作:\n")
                     for operation in temp_operations[:10]:  # 只显示前10个
-                        stats_text += f"  [{operation.get('time', '')}] {operation.get('process', '')} {operation.get('operation', '')} {operation.get('path', '')}\n"
+                        parts.append(f"  [{operation.get('time', '')}] {operation.get('process', '')} {operation.get('operation', '')} {operation.get('path', '')}\n")
                     
                     if len(temp_operations) > 10:
-                        stats_text += f"  ... 还有 {len(temp_operations) - 10} 个临时目录操作\n"
-                    stats_text += "\n"
-            return stats_text
+                        parts.append(f"  ... 还有 {len(temp_operations) - 10} 个临时目录操作\n")
+                    parts.append("\n")
+            return ''.join(parts)
             
         except Exception as e:
             logger.error(f"格式化统计信息时出错: {e}", exc_info=True)
@@ -382,52 +591,46 @@ class FileBehaviorAnalyzer(QWidget):
             if not file_path:
                 return
             
-            # 构造报告数据
-            report_data = {
-                'analysis_time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'time_range': self.time_range_combo.currentText(),
-                'table_data': [],
-                'statistics': self.stats_text.toPlainText()
-            }
+            analysis_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            time_range = self.time_range_combo.currentText()
+            statistics = self.stats_text.toPlainText()
             
-            # 获取表格数据
-            for row in range(self.result_table.rowCount()):
-                row_data = {}
-                for col in range(self.result_table.columnCount()):
-                    item = self.result_table.item(row, col)
-                    if item:
-                        header = self.result_table.horizontalHeaderItem(col).text()
-                        row_data[header] = item.text()
-                report_data['table_data'].append(row_data)
-            
-            # 保存文件
+            # 逐行写出表格数据（按当前排序顺序），不在内存中构造完整报告
             if file_path.endswith('.json'):
                 with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(report_data, f, ensure_ascii=False, indent=2)
+                    f.write('{\n')
+                    f.write(f'  "analysis_time": {json.dumps(analysis_time)},\n')
+                    f.write(f'  "time_range": {json.dumps(time_range, ensure_ascii=False)},\n')
+                    f.write('  "table_data": [')
+                    for i, row_data in enumerate(self.iter_table_rows()):
+                        f.write(',\n    ' if i else '\n    ')
+                        f.write(json.dumps(row_data, ensure_ascii=False))
+                    f.write('\n  ],\n')
+                    f.write(f'  "statistics": {json.dumps(statistics, ensure_ascii=False)}\n')
+                    f.write('}\n')
             elif file_path.endswith('.csv'):
                 import csv
                 with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                    if report_data['table_data']:
-                        fieldnames = list(report_data['table_data'][0].keys())
-                        writer = csv.DictWriter(f, fieldnames=fieldnames)
+                    if self.result_proxy.rowCount():
+                        writer = csv.DictWriter(f, fieldnames=_RESULT_HEADERS)
                         writer.writeheader()
-                        writer.writerows(report_data['table_data'])
+                        writer.writerows(self.iter_table_rows())
                     
                     # 添加统计信息
                     f.write('\n统计信息:\n')
-                    f.write(report_data['statistics'])
+                    f.write(statistics)
             else:
                 with open(file_path, 'w', encoding='utf-8') as f:
                     f.write(f"系统文件行为分析报告\n")
-                    f.write(f"分析时间: {report_data['analysis_time']}\n")
-                    f.write(f"时间范围: {report_data['time_range']}\n\n")
+                    f.write(f"分析时间: {analysis_time}\n")
+                    f.write(f"时间范围: {time_range}\n\n")
                     f.write("详细操作记录:\n")
                     f.write("-" * 80 + "\n")
-                    for row_data in report_data['table_data']:
+                    for row_data in self.iter_table_rows():
                         f.write(f"{row_data}\n")
                     f.write("\n统计信息:\n")
                     f.write("-" * 80 + "\n")
-                    f.write(report_data['statistics'])
+                    f.write(statistics)
             
             QMessageBox.information(self, "导出成功", f"分析报告已导出到:\n{file_path}")
             logger.info(f"分析报告已导出到: {file_path}")
@@ -436,6 +639,17 @@ class FileBehaviorAnalyzer(QWidget):
             logger.error(f"导出分析报告时出错: {e}", exc_info=True)
             QMessageBox.critical(self, "导出失败", f"导出分析报告时出错: {e}")
     
+    def iter_table_rows(self):
+        """
+        按当前过滤和排序顺序逐行生成导出用的表格数据
+        """
+        columns = _RESULT_COLUMNS
+        rows = self.result_model.rows()
+        for proxy_row in range(self.result_proxy.rowCount()):
+            source_row = self.result_proxy.mapToSource(self.result_proxy.index(proxy_row, 0)).row()
+            operation = rows[source_row]
+            yield {header: str(operation.get(key, '')) for header, key in columns}
+    
     def refresh_display(self):
         """
         刷新显示
@@ -443,6 +657,8 @@ class FileBehaviorAnalyzer(QWidget):
         # 如果有之前的分析结果，重新显示
         if self.last_analysis_results:
             self.display_results(self.last_analysis_results)
+            # 按当前选择的时间范围重新过滤表格和统计，保持两者一致
+            self.on_time_range_changed(self.time_range_combo.currentText())
             
             # 如果启用了自动分析，保持其状态
             if self.auto_analyze_btn.isChecked():
@@ -467,16 +683,7 @@ class FileBehaviorAnalyzer(QWidget):
         """
         if checked:
             # 获取分析间隔（基于当前选择的时间范围）
-            time_range_text = self.time_range_combo.currentText()
-            time_ranges = {
-                "最近5分钟": 5,
-                "最近10分钟": 10,
-                "最近30分钟": 30,
-                "最近1小时": 60,
-                "最近2小时": 120,
-                "最近24小时": 1440
-            }
-            minutes = time_ranges.get(time_range_text, 10)
+            minutes = _TIME_RANGES.get(self.time_range_combo.currentText(), 10)
             
             # 设置自动分析间隔为分析时间范围的1/4，但不少于1分钟，不大于30分钟
             interval = max(1, min(30, minutes // 4)) * 60 * 1000  # 转换为毫秒
@@ -498,6 +705,7 @@ class FileAnalyzeWorker(QThread):
     """
     系统文件行为分析工作线程
     """
+    chunk_ready = pyqtSignal(list)
     analysis_finished = pyqtSignal(dict)
     analysis_error = pyqtSignal(str)
     
@@ -508,11 +716,9 @@ class FileAnalyzeWorker(QThread):
     def run(self):
         """
         执行分析任务
+        过滤后的事件按批通过chunk_ready发送，界面可以边分析边显示
         """
         try:
-            # 模拟分析过程
-            time.sleep(2)  # 模拟分析耗时
-            
             # 获取文件事件（模拟数据）
             all_events = SystemUtils.get_file_events(self.time_minutes)
             
@@ -520,18 +726,44 @@ class FileAnalyzeWorker(QThread):
             filtered_events = []
             current_time = time.time()
             
+            # 同一秒内的事件共用格式化后的时间字符串
+            time_cache = {}
+            chunk = []
+            
             for event in all_events:
                 # 检查事件时间是否在指定范围内
                 event_time = event.get('timestamp', 0)
                 time_diff_minutes = (current_time - event_time) / 60  # 转换为分钟
                 
                 if time_diff_minutes <= self.time_minutes and time_diff_minutes >= 0:
-                    # 格式化时间显示
-                    formatted_time = datetime.fromtimestamp(event_time).strftime('%Y-%m-%d %H:%M:%S')
-                    event['time'] = formatted_time
-                    event['operation'] = event.get('type', '').capitalize()
-                    event['details'] = '模拟数据'
-                    filtered_events.append(event)
+                    second = int(event_time)
+                    formatted_time = time_cache.get(second)
+                    if formatted_time is None:
+                        formatted_time = datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')
+                        time_cache[second] = formatted_time
+                    
+                    # 在线程边界一次性转换为FileEvent，后续统计和显示只做属性访问
+                    event_type = event.get('type', '')
+                    operation = _OPERATION_NAMES.get(event_type)
+                    if operation is None:
+                        operation = event_type.capitalize()
+                    file_event = FileEvent(
+                        time=formatted_time,
+                        operation=operation,
+                        path=event.get('path', ''),
+                        process=event.get('process', 'Unknown'),
+                        details='模拟数据',
+                        type=event_type,
+                        timestamp=event_time,
+                    )
+                    filtered_events.append(file_event)
+                    chunk.append(file_event)
+                    if len(chunk) >= _ANALYSIS_CHUNK_SIZE:
+                        self.chunk_ready.emit(chunk)
+                        chunk = []
+            
+            if chunk:
+                self.chunk_ready.emit(chunk)
             
             # 分析统计信息
             statistics = self.analyze_statistics(filtered_events)
@@ -552,73 +784,70 @@ class FileAnalyzeWorker(QThread):
     
     def analyze_statistics(self, events):
         """
-        分析事件统计数据
+        分析事件统计数据（单次遍历完成全部统计）
         """
+        if PANDAS_AVAILABLE and len(events) > _VECTORIZE_THRESHOLD:
+            return self.analyze_statistics_vectorized(events)
+        
         try:
-            statistics = {
-                'total_operations': len(events),
-                'create_operations': len([e for e in events if 'create' in e.get('type', '').lower()]),
-                'modify_operations': len([e for e in events if 'modify' in e.get('type', '').lower()]),
-                'delete_operations': len([e for e in events if 'delete' in e.get('type', '').lower()]),
-                'analysis_type': '基础'
-            }
+            type_counts = dict.fromkeys(_TYPE_BUCKETS.values(), 0)
+            process_stats = Counter()
+            directory_stats = Counter()
+            file_type_stats = Counter()
+            file_operation_count = Counter()
+            suspicious_operations = []
+            temp_dir_operations = []
             
-            # 进程统计
-            process_stats = {}
-            for event in events:
-                process = event.get('process', 'Unknown')
-                process_stats[process] = process_stats.get(process, 0) + 1
-            statistics['process_statistics'] = process_stats
+            suspicious_mask = SystemUtils.is_suspicious_file_event_batch(events)
             
-            # 目录统计
-            directory_stats = {}
-            for event in events:
-                path = event.get('path', '')
+            for event, suspicious in zip(events, suspicious_mask):
+                path = event.path
+                
+                # 操作类型统计
+                bucket = _type_bucket(event.type)
+                if bucket is not None:
+                    type_counts[bucket] += 1
+                
+                # 进程统计
+                process_stats[event.process] += 1
+                
+                # 目录统计
                 directory = os.path.dirname(path)
                 if directory:
-                    directory_stats[directory] = directory_stats.get(directory, 0) + 1
-            statistics['directory_statistics'] = directory_stats
-            
-            # 可疑行为检测
-            suspicious_operations = []
-            for event in events:
-                if SystemUtils.is_suspicious_file_event(event):
+                    directory_stats[directory] += 1
+                
+                # 可疑行为检测
+                if suspicious:
                     suspicious_operations.append(event)
-            statistics['suspicious_operations'] = suspicious_operations
-            
-            # 临时目录操作
-            temp_dir_operations = []
-            for event in events:
-                path = event.get('path', '').lower()
-                if any(temp_dir in path for temp_dir in ['temp\\', 'tmp\\', r'appdata\local\temp']):
+                
+                # 临时目录操作
+                if _TEMP_RE.search(path):
                     temp_dir_operations.append(event)
-            statistics['temp_dir_operations'] = temp_dir_operations
-            
-            # 文件类型统计
-            file_type_stats = {}
-            for event in events:
-                path = event.get('path', '')
+                
+                # 文件类型统计
                 _, ext = os.path.splitext(path)
-                if ext:
-                    file_type_stats[ext] = file_type_stats.get(ext, 0) + 1
-                else:
-                    file_type_stats['无扩展名'] = file_type_stats.get('无扩展名', 0) + 1
-            statistics['file_type_statistics'] = file_type_stats
-            
-            # 高频操作文件
-            file_operation_count = {}
-            for event in events:
-                path = event.get('path', '')
-                file_operation_count[path] = file_operation_count.get(path, 0) + 1
+                file_type_stats[ext or '无扩展名'] += 1
+                
+                # 文件操作次数
+                file_operation_count[path] += 1
             
-            # 获取操作次数最多的文件
-            frequent_files = []
-            for path, count in file_operation_count.items():
-                if count > 1:  # 只包含操作次数大于1的文件
-                    frequent_files.append({'path': path, 'count': count})
+            statistics = {
+                'total_operations': len(events),
+                'create_operations': type_counts['create_operations'],
+                'modify_operations': type_counts['modify_operations'],
+                'delete_operations': type_counts['delete_operations'],
+                'analysis_type': '基础',
+                'process_statistics': dict(process_stats),
+                'directory_statistics': dict(directory_stats),
+                'suspicious_operations': suspicious_operations,
+                'temp_dir_operations': temp_dir_operations,
+                'file_type_statistics': dict(file_type_stats),
+            }
             
-            # 按操作次数排序
-            frequent_files.sort(key=lambda x: x['count'], reverse=True)
+            # 高频操作文件（只包含操作次数大于1的文件，按操作次数排序）
+            frequent_files = [{'path': path, 'count': count}
+                              for path, count in file_operation_count.most_common()
+                              if count > 1]
             statistics['frequent_files'] = frequent_files
             
             return statistics
@@ -628,6 +857,45 @@ class FileAnalyzeWorker(QThread):
             return {}
 
 
+    def analyze_statistics_vectorized(self, events):
+        """
+        使用pandas向量化分析事件统计数据，结果与analyze_statistics一致
+        """
+        try:
+            # FileEvent的字段直接作为列名
+            df = pd.DataFrame(events, columns=FileEvent._fields)
+            type_counts = df['type'].fillna('').astype(str).map(_type_bucket).value_counts()
+            paths = df['path'].fillna('').astype(str)
+            processes = df['process'].fillna('Unknown')
+            
+            directories = paths.map(os.path.dirname)
+            extensions = paths.map(lambda path: os.path.splitext(path)[1] or '无扩展名')
+            temp_mask = paths.str.contains(_TEMP_RE)
+            path_counts = paths.value_counts()
+            
+            statistics = {
+                'total_operations': len(events),
+                'create_operations': int(type_counts.get('create_operations', 0)),
+                'modify_operations': int(type_counts.get('modify_operations', 0)),
+                'delete_operations': int(type_counts.get('delete_operations', 0)),
+                'analysis_type': '基础',
+                'process_statistics': {k: int(v) for k, v in processes.value_counts().items()},
+                'directory_statistics': {k: int(v) for k, v in directories[directories != ''].value_counts().items()},
+                'suspicious_operations': [e for e, suspicious in zip(events, SystemUtils.is_suspicious_file_event_batch(events))
+                                          if suspicious],
+                'temp_dir_operations': [e for e, matched in zip(events, temp_mask.tolist()) if matched],
+                'file_type_statistics': {k: int(v) for k, v in extensions.value_counts().items()},
+                'frequent_files': [{'path': path, 'count': int(count)}
+                                   for path, count in path_counts[path_counts > 1].items()],
+            }
+            
+            return statistics
+            
+        except Exception as e:
+            logger.error(f"向量化分析统计数据时出错: {e}", exc_info=True)
+            return {}
+
+
 class AdvancedFileAnalyzeWorker(QThread):
     """
     高级系统文件行为分析工作线程
@@ -715,17 +983,13 @@ class AdvancedFileAnalyzeWorker(QThread):
             statistics['directory_statistics'] = directory_stats
             
             # 可疑行为检测
-            suspicious_operations = []
-            for event in events:
-                if SystemUtils.is_suspicious_file_event(event):
-                    suspicious_operations.append(event)
-            statistics['suspicious_operations'] = suspicious_operations
+            suspicious_mask = SystemUtils.is_suspicious_file_event_batch(events)
+            statistics['suspicious_operations'] = [e for e, suspicious in zip(events, suspicious_mask) if suspicious]
             
             # 临时目录操作
             temp_dir_operations = []
             for event in events:
-                path = event.get('path', '').lower()
-                if any(temp_dir in path for temp_dir in ['temp\\', 'tmp\\', r'appdata\local\temp']):
+                if _TEMP_RE.search(event.get('path', '')):
                     temp_dir_operations.append(event)
             statistics['temp_dir_operations'] = temp_dir_operations
             
@@ -803,8 +1067,7 @@ class AdvancedFileAnalyzeWorker(QThread):
     
     def is_temp_dir_activity(self, event):
         """判断是否为临时目录活动"""
-        path = event.get('path', '').lower()
-        return any(temp_dir in path for temp_dir in ['temp\\', 'tmp\\', r'appdata\local\temp'])
+        return _TEMP_RE.search(event.get('path', '')) is not None
     
     def is_executable_operation(self, event):
         """判断是否为可执行文件操作"""
@@ -7,27 +7,39 @@
 import logging
 import time
 import os
+import sys
 import random
-from datetime import datetime
+from collections import Counter, deque
+from itertools import islice
 from pathlib import Path
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
-                             QTableWidget, QTableWidgetItem, QLabel, QMessageBox, 
+                             QTableView, QLabel, QMessageBox, 
                              QAbstractItemView, QGroupBox, QFormLayout, QTextEdit,
                              QComboBox, QFileDialog, QHeaderView, QProgressBar,
                              QCheckBox, QLineEdit)
-from PyQt5.QtCore import QTimer, Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QColor
+from PyQt5.QtCore import (QTimer, Qt, QThread, pyqtSignal, QAbstractTableModel,
+                          QModelIndex)
+from PyQt5.QtGui import QColor, QBrush
 
 # 修复导入问题：使用标准导入方式
 try:
-    from utils.system_utils import FileMonitor
+    from utils.system_utils import FileMonitor, SystemUtils
     from config import Config
     from utils.common_utils import show_error_message, show_info_message, format_bytes
 except ImportError:
-    from utils.system_utils import FileMonitor
+    from utils.system_utils import FileMonitor, SystemUtils
     from config import Config
     from utils.common_utils import show_error_message, show_info_message, format_bytes
 
+# 尝试导入watchdog用于接收文件系统变更通知
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # 文件操作类型枚举
@@ -37,14 +49,182 @@ FILE_OPERATION_DELETE = "删除"
 FILE_OPERATION_ACCESS = "访问"
 FILE_OPERATION_UNKNOWN = "未知"
 
+# 自适应监控间隔：按近期每次检查的新事件数调整下次检查时间
+_MONITOR_MIN_INTERVAL = 500      # 最短检查间隔（毫秒）
+_MONITOR_BACKOFF_FACTOR = 4      # 空闲时最长间隔为配置间隔的倍数
+_MONITOR_RATE_ALPHA = 0.3        # 事件速率的指数平滑系数
+
+# 文件事件处理器最多记录的文件修改时间条数，超过后清空重新记录
+_MTIME_CACHE_LIMIT = 10000
+
+# 模拟模式使用的数据
+_SIMULATION_OPERATIONS = (FILE_OPERATION_CREATE, FILE_OPERATION_MODIFY,
+                          FILE_OPERATION_DELETE, FILE_OPERATION_ACCESS)
+_SIMULATION_FILE_PATHS = (
+    "C:\\Windows\\Temp\\temp.tmp",
+    "C:\\Users\\Public\\Downloads\\file.exe",
+    "C:\\ProgramData\\config.dat",
+    "C:\\Users\\User\\Desktop\\document.txt",
+    "C:\\Windows\\System32\\driver.sys",
+)
+_SIMULATION_PROCESSES = ("explorer.exe", "chrome.exe", "notepad.exe", "svchost.exe", "winlogon.exe")
+
+# 操作记录表格的列定义：(表头, 操作记录中的字段名)
+_OPERATION_COLUMNS = (
+    ("时间", "time"),
+    ("进程", "process"),
+    ("操作类型", "operation"),
+    ("文件路径", "file_path"),
+    ("详细信息", "details"),
+)
+
+class FileEventsModel(QAbstractTableModel):
+    """
+    文件操作记录表格模型
+    视图只查询可见行；可疑标记在记录加入模型时计算一次，绘制时直接读取
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._suspicious = []
+        self._headers = tuple(header for header, _ in _OPERATION_COLUMNS)
+        self._cols = tuple(key for _, key in _OPERATION_COLUMNS)
+        self._suspicious_brush = QBrush(Qt.red)  # 可疑操作用红色显示
+    
+    def append_rows(self, rows):
+        """在末尾追加一批操作记录"""
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self._suspicious.extend(SystemUtils.is_suspicious_file_event_batch(
+            [{'path': row.get("file_path", "")} for row in rows]))
+        self.endInsertRows()
+    
+    def remove_first_rows(self, count):
+        """删除最早的若干条记录"""
+        count = min(count, len(self._rows))
+        if count <= 0:
+            return
+        self.beginRemoveRows(QModelIndex(), 0, count - 1)
+        del self._rows[:count]
+        del self._suspicious[:count]
+        self.endRemoveRows()
+    
+    def clear(self):
+        """清空全部记录"""
+        self.beginResetModel()
+        self._rows = []
+        self._suspicious = []
+        self.endResetModel()
+    
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._cols)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            row = self._rows[index.row()]
+            key = self._cols[index.column()]
+            if key == "details" and key not in row:
+                return self._format_details(row)
+            return row.get(key, "")
+        if role == Qt.ForegroundRole and self._suspicious[index.row()]:
+            return self._suspicious_brush
+        return None
+    
+    @staticmethod
+    def _format_details(row):
+        """为未携带详细信息的文件系统事件生成描述，只在行可见时调用"""
+        return f'文件 "{os.path.basename(row.get("file_path", ""))}" 被{row.get("operation", "")}'
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+
+class _FileEventHandler(FileSystemEventHandler):
+    """
+    文件系统事件处理器
+    在watchdog线程中接收事件，通过信号转发到界面线程
+    """
+    
+    def __init__(self, signal):
+        super().__init__()
+        self._signal = signal
+        # 文件路径 -> 上次上报时的st_mtime_ns，用于过滤内容未变化的重复修改通知
+        self._mtimes = {}
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._remember_mtime(event.src_path)
+        self._forward(FILE_OPERATION_CREATE, event)
+    
+    def on_modified(self, event):
+        if event.is_directory:
+            return
+        # 一次写入常触发多次修改通知，只有修改时间确实变化时才上报
+        previous = self._mtimes.get(event.src_path)
+        current = self._remember_mtime(event.src_path)
+        if current is not None and current == previous:
+            return
+        self._forward(FILE_OPERATION_MODIFY, event)
+    
+    def on_deleted(self, event):
+        self._mtimes.pop(event.src_path, None)
+        self._forward(FILE_OPERATION_DELETE, event)
+    
+    def _remember_mtime(self, path):
+        """记录并返回文件当前的修改时间，文件不可访问时返回None"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self._mtimes.pop(path, None)
+            return None
+        if len(self._mtimes) >= _MTIME_CACHE_LIMIT and path not in self._mtimes:
+            self._mtimes.clear()
+        self._mtimes[path] = mtime
+        return mtime
+    
+    def _forward(self, operation, event):
+        if not event.is_directory:
+            self._signal.emit(operation, event.src_path)
+
+
 class FileMonitorTab(QWidget):
     """文件监控标签页"""
     
+    # 文件系统事件（操作类型, 文件路径），由watchdog线程发出
+    file_event_received = pyqtSignal(str, str)
+    
     def __init__(self):
         super().__init__()
         self.monitoring = False
         self.monitor_timer = None
-        self.file_operations = []
+        self._observer = None
+        self.file_monitor = FileMonitor()
+        for path in Config.FILE_MONITOR_PATHS:
+            self.file_monitor.add_path(path)
+        self.file_event_received.connect(self.on_file_event)
+        # 只保留最近的操作记录，并增量维护各类操作的计数
+        self.file_operations = deque(maxlen=Config.MAX_FILE_OPERATIONS_TO_DISPLAY)
+        self._counts = Counter()
+        self._unrendered = 0  # 尚未显示到表格中的记录数
+        self._event_rate = 1.0  # 平滑后的每次检查新事件数
+        self._time_cache = (-1, "")  # (整秒时间戳, 格式化后的时间)，同一秒内的事件共用
         self.is_simulation = Config.FILE_MONITOR_SIMULATION
         
         # 初始化UI
@@ -113,9 +293,9 @@ class FileMonitorTab(QWidget):
         main_layout.addWidget(control_group)
         
         # 文件操作表格
-        self.operation_table = QTableWidget()
-        self.operation_table.setColumnCount(5)
-        self.operation_table.setHorizontalHeaderLabels(["时间", "进程", "操作类型", "文件路径", "详细信息"])
+        self.operation_model = FileEventsModel(self)
+        self.operation_table = QTableView()
+        self.operation_table.setModel(self.operation_model)
         self.operation_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.operation_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.operation_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
@@ -143,8 +323,9 @@ class FileMonitorTab(QWidget):
         
         self.setLayout(main_layout)
         
-        # 初始化定时器
+        # 初始化定时器，每次检查后按事件速率重新调度
         self.monitor_timer = QTimer()
+        self.monitor_timer.setSingleShot(True)
         self.monitor_timer.timeout.connect(self.check_file_operations)
         
     def toggle_simulation_mode(self, state):
@@ -152,10 +333,20 @@ class FileMonitorTab(QWidget):
         self.is_simulation = state == Qt.Checked
         logger.info(f"模拟模式切换到: {self.is_simulation}")
         
+        # 监控运行中切换模式时同步启停文件系统通知
+        if self.monitoring:
+            if self.is_simulation:
+                self.stop_observer()
+            else:
+                self.start_observer()
+        
     def start_monitoring(self):
         """开始监控"""
         try:
             self.monitoring = True
+            self._event_rate = 1.0
+            if not self.is_simulation:
+                self.start_observer()
             self.monitor_timer.start(Config.FILE_MONITOR_REFRESH_INTERVAL)
             self.start_btn.setEnabled(False)
             self.stop_btn.setEnabled(True)
@@ -170,6 +361,7 @@ class FileMonitorTab(QWidget):
         try:
             self.monitoring = False
             self.monitor_timer.stop()
+            self.stop_observer()
             self.start_btn.setEnabled(True)
             self.stop_btn.setEnabled(False)
             self.info_label.setText("文件监控: 已停止")
@@ -178,11 +370,82 @@ class FileMonitorTab(QWidget):
             logger.error(f"停止文件监控失败: {e}")
             show_error_message(self, "错误", f"停止文件监控失败: {str(e)}")
             
+    def start_observer(self):
+        """
+        启动文件系统通知，由操作系统推送变更事件（Windows使用ReadDirectoryChangesW，Linux使用inotify）
+        
+        Returns:
+            bool: 是否成功启动
+        """
+        if self._observer is not None:
+            return True
+        if not WATCHDOG_AVAILABLE:
+            logger.warning("未安装watchdog模块，实际模式将使用模拟数据")
+            return False
+        
+        paths = self.file_monitor.get_monitored_paths()
+        if not paths:
+            logger.warning("没有可监控的目录，实际模式将使用模拟数据")
+            return False
+        
+        try:
+            observer = Observer()
+            handler = _FileEventHandler(self.file_event_received)
+            for path in paths:
+                if self.file_monitor.is_directory(path):
+                    observer.schedule(handler, path, recursive=True)
+                else:
+                    # 单个文件通过监听其所在目录获得通知
+                    observer.schedule(handler, os.path.dirname(path) or '.', recursive=False)
+            observer.start()
+            self._observer = observer
+            self.file_monitor.start_monitoring()
+            logger.info(f"文件系统通知已启动，监控目录: {paths}")
+            return True
+        except Exception as e:
+            logger.error(f"启动文件系统通知失败: {e}")
+            return False
+    
+    def stop_observer(self):
+        """停止文件系统通知"""
+        if self._observer is None:
+            return
+        try:
+            self._observer.stop()
+            self._observer.join(timeout=2)
+        except Exception as e:
+            logger.error(f"停止文件系统通知失败: {e}")
+        finally:
+            self._observer = None
+            self.file_monitor.stop_monitoring()
+    
+    def _event_time(self):
+        """返回当前时间的显示字符串，同一秒内只格式化一次"""
+        now = int(time.time())
+        if now != self._time_cache[0]:
+            self._time_cache = (now, time.strftime("%H:%M:%S", time.localtime(now)))
+        return self._time_cache[1]
+    
+    def on_file_event(self, operation, file_path):
+        """文件系统事件回调（界面线程）"""
+        # 信号传递后得到的是新字符串；驻留后同一操作类型和反复变化的同一文件只保留一份
+        operation = sys.intern(operation)
+        file_path = sys.intern(file_path)
+        self.add_file_operation({
+            "time": self._event_time(),
+            "process": FILE_OPERATION_UNKNOWN,
+            "operation": operation,
+            "file_path": file_path
+            # 不预先生成详细信息，行显示时再由模型拼接
+        })
+    
     def clear_records(self):
         """清空记录"""
         try:
-            self.operation_table.setRowCount(0)
+            self.operation_model.clear()
             self.file_operations.clear()
+            self._counts = Counter()
+            self._unrendered = 0
             self.update_stats()
             logger.info("文件操作记录已清空")
         except Exception as e:
@@ -192,60 +455,54 @@ class FileMonitorTab(QWidget):
     def check_file_operations(self):
         """检查文件操作"""
         try:
-            if self.is_simulation:
-                # 模拟模式：生成随机文件操作
-                self.generate_simulation_data()
-            else:
-                # 实际模式：应该调用系统API获取真实文件操作
-                # 由于在当前环境中无法实现，暂时使用模拟数据
+            if self.is_simulation or self._observer is None:
+                # 模拟模式，或实际模式下文件系统通知不可用时，生成随机文件操作
                 self.generate_simulation_data()
+            # 实际模式的事件由文件系统通知推送，这里只负责刷新界面
                 
             # 更新UI
+            new_count = self._unrendered
             self.update_file_operations_display()
+            self._event_rate += _MONITOR_RATE_ALPHA * (new_count - self._event_rate)
         except Exception as e:
             logger.error(f"检查文件操作时出错: {e}")
+        finally:
+            if self.monitoring:
+                self.schedule_next_check()
+    
+    def schedule_next_check(self):
+        """按近期事件速率调度下一次检查：事件多时缩短间隔，空闲时逐步放宽"""
+        base = Config.FILE_MONITOR_REFRESH_INTERVAL
+        interval = base / max(self._event_rate, 1.0 / _MONITOR_BACKOFF_FACTOR)
+        interval = int(min(max(interval, _MONITOR_MIN_INTERVAL), base * _MONITOR_BACKOFF_FACTOR))
+        self.monitor_timer.start(interval)
             
     def update_file_operations_display(self):
-        """更新文件操作显示"""
+        """更新文件操作显示，只追加上次显示之后新增的记录"""
+        # 上次显示后没有新记录时，表格和统计都无需刷新
+        if not self._unrendered:
+            return
         try:
-            # 清空表格
-            self.operation_table.setRowCount(0)
+            total = len(self.file_operations)
+            new_count = min(self._unrendered, total)
+            new_operations = list(islice(self.file_operations, total - new_count, total))
             
-            # 添加文件操作记录到表格
-            for operation in self.file_operations:
-                row_position = self.operation_table.rowCount()
-                self.operation_table.insertRow(row_position)
-                
-                # 时间
-                time_item = QTableWidgetItem(operation.get("time", ""))
-                time_item.setFlags(time_item.flags() & ~Qt.ItemIsEditable)
-                self.operation_table.setItem(row_position, 0, time_item)
-                
-                # 进程
-                process_item = QTableWidgetItem(operation.get("process", ""))
-                process_item.setFlags(process_item.flags() & ~Qt.ItemIsEditable)
-                self.operation_table.setItem(row_position, 1, process_item)
-                
-                # 操作类型
-                operation_item = QTableWidgetItem(operation.get("operation", ""))
-                operation_item.setFlags(operation_item.flags() & ~Qt.ItemIsEditable)
-                self.operation_table.setItem(row_position, 2, operation_item)
-                
-                # 文件路径
-                file_path_item = QTableWidgetItem(operation.get("file_path", ""))
-                file_path_item.setFlags(file_path_item.flags() & ~Qt.ItemIsEditable)
-                self.operation_table.setItem(row_position, 3, file_path_item)
+            # 批量更新期间暂停重绘；表格已设置为不可编辑，整行追加到模型
+            self.operation_table.setUpdatesEnabled(False)
+            try:
+                self.operation_model.append_rows(new_operations)
+                self._unrendered = 0
                 
-                # 详细信息
-                details_item = QTableWidgetItem(operation.get("details", ""))
-                details_item.setFlags(details_item.flags() & ~Qt.ItemIsEditable)
-                self.operation_table.setItem(row_position, 4, details_item)
+                # 删除已被淘汰的旧记录对应的行
+                self.operation_model.remove_first_rows(self.operation_model.rowCount() - total)
+            finally:
+                self.operation_table.setUpdatesEnabled(True)
                 
             # 更新统计信息
             self.update_stats()
             
-            # 滚动到最后一行
-            if self.file_operations:
+            # 有新记录时滚动到最后一行
+            if new_operations:
                 self.operation_table.scrollToBottom()
                 
         except Exception as e:
@@ -254,13 +511,10 @@ class FileMonitorTab(QWidget):
     def update_stats(self):
         """更新统计信息"""
         try:
-            total_count = len(self.file_operations)
-            create_count = sum(1 for op in self.file_operations if op.get("operation") == FILE_OPERATION_CREATE)
-            modify_count = sum(1 for op in self.file_operations if op.get("operation") == FILE_OPERATION_MODIFY)
-            delete_count = sum(1 for op in self.file_operations if op.get("operation") == FILE_OPERATION_DELETE)
-            access_count = sum(1 for op in self.file_operations if op.get("operation") == FILE_OPERATION_ACCESS)
-            
-            stats_text = f"总操作数: {total_count} | 创建: {create_count} | 修改: {modify_count} | 删除: {delete_count} | 访问: {access_count}"
+            c = self._counts
+            stats_text = (f"总操作数: {len(self.file_operations)} | 创建: {c[FILE_OPERATION_CREATE]} | "
+                          f"修改: {c[FILE_OPERATION_MODIFY]} | 删除: {c[FILE_OPERATION_DELETE]} | "
+                          f"访问: {c[FILE_OPERATION_ACCESS]}")
             self.stats_label.setText(stats_text)
         except Exception as e:
             logger.error(f"更新统计信息时出错: {e}")
@@ -268,26 +522,17 @@ class FileMonitorTab(QWidget):
     def generate_simulation_data(self):
         """生成模拟数据"""
         # 生成随机文件操作
-        operations = [FILE_OPERATION_CREATE, FILE_OPERATION_MODIFY, FILE_OPERATION_DELETE, FILE_OPERATION_ACCESS]
-        operation = random.choice(operations)
+        operation = random.choice(_SIMULATION_OPERATIONS)
         
         # 随机生成文件路径
-        file_paths = [
-            "C:\\Windows\\Temp\\temp.tmp",
-            "C:\\Users\\Public\\Downloads\\file.exe",
-            "C:\\ProgramData\\config.dat",
-            "C:\\Users\\User\\Desktop\\document.txt",
-            "C:\\Windows\\System32\\driver.sys"
-        ]
-        file_path = random.choice(file_paths)
+        file_path = random.choice(_SIMULATION_FILE_PATHS)
         
         # 随机生成进程名
-        processes = ["explorer.exe", "chrome.exe", "notepad.exe", "svchost.exe", "winlogon.exe"]
-        process = random.choice(processes)
+        process = random.choice(_SIMULATION_PROCESSES)
         
         # 创建操作记录
         operation_record = {
-            "time": datetime.now().strftime("%H:%M:%S"),
+            "time": self._event_time(),
             "process": process,
             "operation": operation,
             "file_path": file_path,
@@ -295,5 +540,21 @@ class FileMonitorTab(QWidget):
         }
         
         # 添加到操作列表
+        self.add_file_operation(operation_record)
+        
+    def add_file_operation(self, operation_record):
+        """添加文件操作记录，并同步更新操作计数"""
+        if len(self.file_operations) == self.file_operations.maxlen:
+            evicted = self.file_operations[0]
+            self._counts[evicted.get("operation")] -= 1
+        
         self.file_operations.append(operation_record)
-
+        self._unrendered += 1
+        self._counts[operation_record.get("operation")] += 1
+    
+    def cleanup(self):
+        """清理资源"""
+        self.monitoring = False
+        if self.monitor_timer:
+            self.monitor_timer.stop()
+        self.stop_observer()
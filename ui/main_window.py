@@ -4,22 +4,20 @@
 提供系统安全分析工具的主界面
 """
 
+import gc
+import importlib
 import logging
 import os
-import sys
 import psutil
 import time
+from functools import partial
 from PyQt5.QtWidgets import (QMainWindow, QTabWidget, QVBoxLayout, QWidget, 
                              QMenuBar, QAction, QMessageBox, QToolBar, QSizePolicy,
-                             QStatusBar, QLabel)
-from PyQt5.QtCore import QSize, Qt, QTimer
+                             QStatusBar, QLabel, QPushButton)
+from PyQt5.QtCore import (QSize, Qt, QTimer, QEvent, QObject, QThread, pyqtSignal,
+                          pyqtSlot)
 from PyQt5.QtGui import QIcon
 
-# 添加项目根目录到sys.path以确保能正确导入config模块
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
-
 # 导入配置模块
 try:
     from config import Config
@@ -41,7 +39,7 @@ except ImportError as e:
         ENABLE_SANDBOX = True
         CONFIRM_BEFORE_KILL_PROCESS = True
         MAX_RECENT_FILES = 10
-        PERFORMANCE_MONITOR_INTERVAL = 1000
+        PERFORMANCE_MONITOR_INTERVAL = 2000
         ENABLE_MEMORY_OPTIMIZATION = True
         MEMORY_CLEANUP_INTERVAL = 30000
         
@@ -53,81 +51,149 @@ except ImportError as e:
 from utils.common_utils import show_error_message, show_info_message
 from utils.decorators import performance_monitor
 
-# 从UI包直接导入所有标签页类
-# 使用直接导入避免触发ui.__init__.py中的警告
-try:
-    from ui.process_tab import ProcessTab
-    from ui.network_tab import NetworkTab
-    from ui.startup_tab import StartupTab
-    from ui.registry_tab import RegistryTab
-    from ui.file_monitor_tab import FileMonitorTab
-    from ui.popup_blocker_tab import PopupBlockerTab
-    from ui.modules_tab import ModulesTab
-    from ui.sandbox_tab import SandboxTab
-    from ui.file_behavior_analyzer import FileBehaviorAnalyzer
-    
-    logging.info("✅ 所有标签页类导入成功")
+# 标签页定义：(属性名, 模块名, 类名, 标题)
+# 启动时只添加空的容器页，标签页模块在首次切换到该页时才导入并创建控件
+# 直接导入各子模块，避免触发ui.__init__.py中的警告
+_TAB_SPECS = (
+    ('process_tab', 'ui.process_tab', 'ProcessTab', "进程管理"),
+    ('network_tab', 'ui.network_tab', 'NetworkTab', "网络监控"),
+    ('startup_tab', 'ui.startup_tab', 'StartupTab', "启动项管理"),
+    ('registry_tab', 'ui.registry_tab', 'RegistryTab', "注册表监控"),
+    ('file_monitor_tab', 'ui.file_monitor_tab', 'FileMonitorTab', "文件监控"),
+    ('popup_blocker_tab', 'ui.popup_blocker_tab', 'PopupBlockerTab', "弹窗拦截"),
+    ('modules_tab', 'ui.modules_tab', 'ModulesTab', "内核模块"),
+    ('sandbox_tab', 'ui.sandbox_tab', 'SandboxTab', "沙箱分析"),
+    ('file_behavior_tab', 'ui.file_behavior_analyzer', 'FileBehaviorAnalyzer', "文件行为分析"),
+)
+_TAB_SPEC_BY_ATTR = {spec[0]: spec for spec in _TAB_SPECS}
+
+# 主窗口会调用的标签页方法，标签页创建时查找一次并缓存
+_TAB_HOOKS = ('refresh_display', 'start_auto_refresh', 'stop_auto_refresh', 'cleanup')
+
+# 动作定义：(动作名, 文字, 工具栏文字, 槽函数名, 快捷键)，菜单和工具栏共用同一个动作实例
+_ACTION_SPECS = (
+    ('exit', '退出', None, 'close', 'Ctrl+Q'),
+    ('refresh', '刷新当前标签页', '刷新', 'refresh_current_tab', 'F5'),
+    ('analyze', '一键分析系统', '一键分析', 'one_click_analysis', 'F6'),
+    ('about', '关于', None, 'show_about', None),
+)
+
+# 菜单定义：(菜单标题, 动作名列表)，None表示分隔线
+_MENU_SPECS = (
+    ('文件', ('exit',)),
+    ('视图', ('refresh',)),
+    ('工具', ('analyze',)),
+    ('帮助', ('about',)),
+)
+
+# 工具栏动作名，None表示分隔线
+_TOOLBAR_SPECS = ('refresh', 'analyze')
+
+
+def _load_tab_class(module_name, class_name):
+    """
+    按需导入标签页类
     
-except ImportError as e:
-    logging.error("❌ 标签页类导入失败: {}".format(e))
-    # 创建占位符类
-    class ProcessTab:
-        def __init__(self):
-            raise ImportError("ProcessTab导入失败")
-    
-    class NetworkTab:
-        def __init__(self):
-            raise ImportError("NetworkTab导入失败")
-    
-    class StartupTab:
-        def __init__(self):
-            raise ImportError("StartupTab导入失败")
-    
-    class RegistryTab:
-        def __init__(self):
-            raise ImportError("RegistryTab导入失败")
-    
-    class FileMonitorTab:
-        def __init__(self):
-            raise ImportError("FileMonitorTab导入失败")
-    
-    class PopupBlockerTab:
-        def __init__(self):
-            raise ImportError("PopupBlockerTab导入失败")
-    
-    class ModulesTab:
-        def __init__(self):
-            raise ImportError("ModulesTab导入失败")
-    
-    class SandboxTab:
-        def __init__(self):
-            raise ImportError("SandboxTab导入失败")
-    
-    class FileBehaviorAnalyzer:
-        def __init__(self):
-            raise ImportError("FileBehaviorAnalyzer导入失败")
+    Args:
+        module_name (str): 模块名
+        class_name (str): 类名
+        
+    Returns:
+        type: 标签页类
+    """
+    tab_class = getattr(importlib.import_module(module_name), class_name)
+    logging.info("✅ 标签页类 {} 导入成功".format(class_name))
+    return tab_class
+
+# 定时资源清理轮换回收代数：每次回收第0代，每_GC_GEN1_TICKS次回收到第1代，每_GC_FULL_TICKS次完整回收
+_GC_GEN1_TICKS = 10
+_GC_FULL_TICKS = 60
+
+# 配置项在导入时读取一次，之后不再重复查找；内置默认配置缺少的项使用默认值
+_WINDOW_WIDTH = getattr(Config, 'WINDOW_WIDTH', 1400)
+_WINDOW_HEIGHT = getattr(Config, 'WINDOW_HEIGHT', 900)
+_PERFORMANCE_MONITOR_INTERVAL = getattr(Config, 'PERFORMANCE_MONITOR_INTERVAL', None)
+_MASTER_TICK_INTERVAL = _PERFORMANCE_MONITOR_INTERVAL or 2000
+_MEMORY_CLEANUP_TICKS = (max(1, getattr(Config, 'MEMORY_CLEANUP_INTERVAL', 30000) // _MASTER_TICK_INTERVAL)
+                         if getattr(Config, 'ENABLE_MEMORY_OPTIMIZATION', True) else 0)
+_GC_THRESHOLD = getattr(Config, 'GC_THRESHOLD', (50000, 20, 20))
+_GC_MIN_GEN0 = getattr(Config, 'GC_MIN_GEN0', 1000)
+_GC_MIN_GEN1 = getattr(Config, 'GC_MIN_GEN1', 5)
+
+# 窗口标题和关于对话框内容在运行期间不变，导入时格式化一次
+_WINDOW_TITLE = "{} v{}".format(Config.APP_NAME, Config.VERSION)
+_ABOUT_BODY = ("{} v{}\n\n"
+               "系统安全分析工具\n"
+               "帮助用户深入了解系统运行状态，检测恶意软件，优化系统性能\n\n"
+               "QQ群：1056878281").format(Config.APP_NAME, Config.VERSION)
+
+# 状态栏性能信息显示模板
+_PERFORMANCE_FORMAT = "内存: {:.1f} MB | CPU: {:.1f}%"
+
+
+class PerformanceSampler(QObject):
+    """
+    当前进程性能采样器
+    移动到后台线程中执行psutil调用，采样结果通过信号交给界面线程显示
+    """
+    sample_ready = pyqtSignal(float, float)  # (内存MB, CPU使用率%)
+    
+    def __init__(self):
+        super().__init__()
+        # 复用同一个进程对象：cpu_percent需要与上一次调用比较，新建对象每次都返回0
+        self._process = psutil.Process(os.getpid())
+        # 首次调用cpu_percent只记录基准并返回0，在此预先调用，第一次采样即可得到有效读数
+        self._process.cpu_percent(None)
+    
+    @pyqtSlot()
+    def run_once(self):
+        """采样一次内存和CPU使用情况"""
+        try:
+            process = self._process
+            # oneshot内多次查询共用同一次系统读取结果
+            with process.oneshot():
+                memory_mb = process.memory_info().rss / 1024 / 1024
+                cpu_percent = process.cpu_percent(None)
+            self.sample_ready.emit(memory_mb, cpu_percent)
+        except Exception as e:
+            logging.error("采样性能信息时出错: " + str(e))
 
 
 class MainWindow(QMainWindow):
     """主窗口类"""
     
+    # 窗口即将关闭，已创建标签页的stop_auto_refresh在创建时连接到该信号
+    about_to_close = pyqtSignal()
+    # 请求后台线程采样一次性能信息
+    sample_requested = pyqtSignal()
+    
     def __init__(self):
         super().__init__()
-        self.resource_timer = None
-        self.performance_timer = None
+        self.master_timer = None
+        self._master_tick = 0
+        self._perf_thread = None
+        self._perf_sampler = None
+        self._last_performance_values = None  # 上次显示的(内存MB, CPU%)，按显示精度取整
+        self._tab_hooks = {}  # 标签页控件 -> {方法名: 绑定方法或None}
+        self._gc_tick = 0  # 定时资源清理次数，用于轮换回收代数
+        self._actions = {}  # 动作名 -> QAction
         self.init_ui()
+        self.create_actions()
         self.create_menu_bar()
         self.create_toolbar()
         self.create_status_bar()
         self.setup_resource_management()
+        # 放宽第0代阈值，减少界面线程上的小回收次数
+        gc.set_threshold(*_GC_THRESHOLD)
+        # 启动阶段创建的模块级对象和主窗口会一直存活，移出回收跟踪，之后的完整回收不再扫描
+        gc.freeze()
         logging.info("主窗口初始化完成")
     
     def init_ui(self):
         """初始化UI"""
         try:
-            # 直接使用Config确保能正确访问配置
-            self.setWindowTitle("{} v{}".format(Config.APP_NAME, Config.VERSION))
-            self.setGeometry(100, 100, Config.WINDOW_WIDTH, Config.WINDOW_HEIGHT)
+            self.setWindowTitle(_WINDOW_TITLE)
+            self.setGeometry(100, 100, _WINDOW_WIDTH, _WINDOW_HEIGHT)
             self.setMinimumSize(800, 600)
             
             # 创建中央窗口部件
@@ -144,27 +210,20 @@ class MainWindow(QMainWindow):
             self.tab_widget.setTabsClosable(False)
             self.tab_widget.setMovable(True)
             
-            # 创建各个标签页
-            self.process_tab = ProcessTab()
-            self.network_tab = NetworkTab()
-            self.startup_tab = StartupTab()
-            self.registry_tab = RegistryTab()
-            self.file_monitor_tab = FileMonitorTab()
-            self.popup_blocker_tab = PopupBlockerTab()
-            self.modules_tab = ModulesTab()
-            self.sandbox_tab = SandboxTab()
-            self.file_behavior_tab = FileBehaviorAnalyzer()
-            
-            # 添加标签页
-            self.tab_widget.addTab(self.process_tab, "进程管理")
-            self.tab_widget.addTab(self.network_tab, "网络监控")
-            self.tab_widget.addTab(self.startup_tab, "启动项管理")
-            self.tab_widget.addTab(self.registry_tab, "注册表监控")
-            self.tab_widget.addTab(self.file_monitor_tab, "文件监控")
-            self.tab_widget.addTab(self.popup_blocker_tab, "弹窗拦截")
-            self.tab_widget.addTab(self.modules_tab, "内核模块")
-            self.tab_widget.addTab(self.sandbox_tab, "沙箱分析")
-            self.tab_widget.addTab(self.file_behavior_tab, "文件行为分析")
+            # 先添加空的容器页，标签页控件在首次切换到该页时才创建
+            self._tab_pages = {}   # 属性名 -> 容器页
+            self._page_attrs = {}  # 容器页 -> 属性名（标签页可拖动，不能按索引查找）
+            for attr, _, _, title in _TAB_SPECS:
+                page = QWidget()
+                page_layout = QVBoxLayout(page)
+                page_layout.setContentsMargins(0, 0, 0, 0)
+                setattr(self, attr, None)
+                self._tab_pages[attr] = page
+                self._page_attrs[page] = attr
+                self.tab_widget.addTab(page, title)
+            
+            self.tab_widget.currentChanged.connect(self.on_tab_changed)
+            self.on_tab_changed(self.tab_widget.currentIndex())
             
             main_layout.addWidget(self.tab_widget)
             
@@ -173,43 +232,132 @@ class MainWindow(QMainWindow):
             logging.error("初始化UI时出错: " + str(e))
             show_error_message(self, "错误", "初始化UI时出错: {}".format(str(e)))
     
+    def on_tab_changed(self, index):
+        """标签页切换事件处理，首次切换到某页时创建该标签页"""
+        page = self.tab_widget.widget(index)
+        attr = self._page_attrs.get(page)
+        if attr is not None:
+            self.ensure_tab(attr)
+    
+    def eventFilter(self, obj, event):
+        """
+        标签页显示时启动自动刷新，隐藏时停止
+        切换标签页和最小化/还原窗口都会产生显示/隐藏事件，只有可见的标签页在刷新
+        """
+        event_type = event.type()
+        if event_type == QEvent.Show or event_type == QEvent.Hide:
+            hooks = self._tab_hooks.get(obj)
+            if hooks:
+                hook = hooks['start_auto_refresh' if event_type == QEvent.Show else 'stop_auto_refresh']
+                if hook:
+                    hook()
+        return super().eventFilter(obj, event)
+    
+    def ensure_tab(self, attr):
+        """
+        确保指定标签页已创建
+        
+        Args:
+            attr (str): 标签页属性名
+            
+        Returns:
+            QWidget: 标签页控件，创建失败时返回None
+        """
+        tab = getattr(self, attr, None)
+        page = self._tab_pages[attr]
+        if tab is not None or getattr(page, '_tab_failed', False):
+            return tab
+        
+        _, module_name, class_name, _ = _TAB_SPEC_BY_ATTR[attr]
+        try:
+            tab = _load_tab_class(module_name, class_name)()
+        except Exception as e:
+            # 单个标签页创建失败不影响其他标签页
+            logging.error("❌ 标签页 {} 创建失败: {}".format(attr, e))
+            page._tab_failed = True
+            error_widget = QWidget()
+            error_layout = QVBoxLayout(error_widget)
+            error_layout.addWidget(QLabel("加载失败: {}".format(e)))
+            retry_btn = QPushButton("重试")
+            retry_btn.clicked.connect(partial(self.retry_load_tab, attr))
+            error_layout.addWidget(retry_btn)
+            error_layout.addStretch()
+            page.layout().addWidget(error_widget)
+            return None
+        
+        # 由显示/隐藏事件驱动自动刷新，须在加入容器页（随即显示）之前安装
+        hooks = {name: self._get_hook(tab, name) for name in _TAB_HOOKS}
+        self._tab_hooks[tab] = hooks
+        if hooks['stop_auto_refresh']:
+            self.about_to_close.connect(hooks['stop_auto_refresh'])
+        tab.installEventFilter(self)
+        page.layout().addWidget(tab)
+        setattr(self, attr, tab)
+        logging.info("标签页 {} 创建完成".format(attr))
+        return tab
+    
+    @staticmethod
+    def _get_hook(tab, name):
+        """返回标签页的可调用方法，不存在时返回None"""
+        hook = getattr(tab, name, None)
+        return hook if callable(hook) else None
+    
+    def _hook(self, tab, name):
+        """取缓存的标签页方法，未创建的标签页返回None"""
+        hooks = self._tab_hooks.get(tab)
+        return hooks[name] if hooks else None
+    
+    def show_tab(self, attr):
+        """
+        切换到指定标签页（按属性名直接取容器页，不按标题逐个查找）
+        
+        Args:
+            attr (str): 标签页属性名
+            
+        Returns:
+            bool: 是否找到该标签页
+        """
+        page = self._tab_pages.get(attr)
+        if page is None:
+            return False
+        self.tab_widget.setCurrentWidget(page)
+        return True
+    
+    def retry_load_tab(self, attr):
+        """重新加载创建失败的标签页"""
+        page = self._tab_pages[attr]
+        layout = page.layout()
+        while layout.count():
+            widget = layout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        page._tab_failed = False
+        
+        self.ensure_tab(attr)
+    
+    def create_actions(self):
+        """创建菜单栏和工具栏共用的动作"""
+        for name, text, icon_text, slot, shortcut in _ACTION_SPECS:
+            action = QAction(text, self)
+            if icon_text:
+                action.setIconText(icon_text)
+            if shortcut:
+                action.setShortcut(shortcut)
+            action.triggered.connect(getattr(self, slot))
+            self._actions[name] = action
+    
     def create_menu_bar(self):
         """创建菜单栏"""
         try:
             menubar = self.menuBar()
             
-            # 文件菜单
-            file_menu = menubar.addMenu('文件')
-            
-            exit_action = QAction('退出', self)
-            exit_action.setShortcut('Ctrl+Q')
-            exit_action.triggered.connect(self.close)
-            file_menu.addAction(exit_action)
-            
-            # 视图菜单
-            view_menu = menubar.addMenu('视图')
-            
-            # 添加刷新当前标签页动作
-            refresh_action = QAction('刷新当前标签页', self)
-            refresh_action.setShortcut('F5')
-            refresh_action.triggered.connect(self.refresh_current_tab)
-            view_menu.addAction(refresh_action)
-            
-            # 工具菜单
-            tools_menu = menubar.addMenu('工具')
-            
-            # 添加一键分析动作
-            analyze_action = QAction('一键分析系统', self)
-            analyze_action.setShortcut('F6')
-            analyze_action.triggered.connect(self.one_click_analysis)
-            tools_menu.addAction(analyze_action)
-            
-            # 帮助菜单
-            help_menu = menubar.addMenu('帮助')
-            
-            about_action = QAction('关于', self)
-            about_action.triggered.connect(self.show_about)
-            help_menu.addAction(about_action)
+            for title, entries in _MENU_SPECS:
+                menu = menubar.addMenu(title)
+                for entry in entries:
+                    if entry is None:
+                        menu.addSeparator()
+                    else:
+                        menu.addAction(self._actions[entry])
             
         except Exception as e:
             logging.error("创建菜单栏时出错: " + str(e))
@@ -221,15 +369,11 @@ class MainWindow(QMainWindow):
             toolbar.setMovable(False)
             toolbar.setIconSize(QSize(24, 24))
             
-            # 添加刷新按钮
-            refresh_action = QAction("刷新", self)
-            refresh_action.triggered.connect(self.refresh_current_tab)
-            toolbar.addAction(refresh_action)
-            
-            # 添加分析按钮
-            analyze_action = QAction("一键分析", self)
-            analyze_action.triggered.connect(self.one_click_analysis)
-            toolbar.addAction(analyze_action)
+            for entry in _TOOLBAR_SPECS:
+                if entry is None:
+                    toolbar.addSeparator()
+                else:
+                    toolbar.addAction(self._actions[entry])
             
         except Exception as e:
             logging.error("创建工具栏时出错: " + str(e))
@@ -249,20 +393,25 @@ class MainWindow(QMainWindow):
     def setup_resource_management(self):
         """设置资源管理"""
         try:
-            # 设置资源清理定时器
-            if getattr(Config, 'ENABLE_MEMORY_OPTIMIZATION', True):
-                self.resource_timer = QTimer(self)
-                self.resource_timer.timeout.connect(self.cleanup_resources)
-                interval = getattr(Config, 'MEMORY_CLEANUP_INTERVAL', 30000)
-                self.resource_timer.start(interval)
-                logging.info("资源清理定时器已启动")
-            
-            # 设置性能监控定时器
-            if hasattr(Config, 'PERFORMANCE_MONITOR_INTERVAL'):
-                self.performance_timer = QTimer(self)
-                self.performance_timer.timeout.connect(self.update_performance_info)
-                self.performance_timer.start(Config.PERFORMANCE_MONITOR_INTERVAL)
-                logging.info("性能监控定时器已启动")
+            # 性能监控和资源清理共用一个定时器：每个节拍采样一次性能，每隔若干节拍清理一次资源
+            if _PERFORMANCE_MONITOR_INTERVAL:
+                # psutil采样在后台线程执行，采样请求信号跨线程排队触发
+                self._perf_thread = QThread(self)
+                self._perf_sampler = PerformanceSampler()
+                self._perf_sampler.moveToThread(self._perf_thread)
+                self._perf_thread.finished.connect(self._perf_sampler.deleteLater)
+                self.sample_requested.connect(self._perf_sampler.run_once)
+                self._perf_sampler.sample_ready.connect(self.update_performance_info)
+                self._perf_thread.start()
+            
+            if self._perf_sampler or _MEMORY_CLEANUP_TICKS:
+                # 状态栏读数无需精确定时；间隔低于2秒时QTimer默认使用精确定时器，
+                # 在Windows上会提高系统全局定时器精度、增加功耗，因此显式使用粗略定时器
+                self.master_timer = QTimer(self)
+                self.master_timer.setTimerType(Qt.CoarseTimer)
+                self.master_timer.timeout.connect(self.on_master_tick)
+                self.master_timer.start(_MASTER_TICK_INTERVAL)
+                logging.info("主定时器已启动")
                 
         except Exception as e:
             logging.error("设置资源管理时出错: " + str(e))
@@ -270,9 +419,11 @@ class MainWindow(QMainWindow):
     def refresh_current_tab(self):
         """刷新当前标签页"""
         try:
-            current_widget = self.tab_widget.currentWidget()
-            if hasattr(current_widget, 'refresh_display'):
-                current_widget.refresh_display()
+            attr = self._page_attrs.get(self.tab_widget.currentWidget())
+            current_widget = getattr(self, attr, None) if attr else None
+            refresh_display = self._hook(current_widget, 'refresh_display')
+            if refresh_display:
+                refresh_display()
             else:
                 logging.warning("当前标签页没有refresh_display方法")
         except Exception as e:
@@ -280,80 +431,185 @@ class MainWindow(QMainWindow):
             show_error_message(self, "错误", "刷新当前标签页时出错: {}".format(str(e)))
     
     def one_click_analysis(self):
-        """一键分析系统"""
+        """
+        一键分析系统
+        分析在文件行为分析标签页的工作线程中执行，完成后通过信号回调提示结果；
+        分析期间禁用一键分析动作，避免重复启动
+        """
         try:
-            # 这里可以调用各个标签页的分析功能
             logging.info("开始一键分析系统")
-            self.statusBar().showMessage("正在执行一键分析...")
             
             # 调用文件行为分析标签页的分析功能
-            if hasattr(self.file_behavior_tab, 'start_analysis'):
-                self.file_behavior_tab.start_analysis()
+            file_behavior_tab = self.ensure_tab('file_behavior_tab')
+            if not hasattr(file_behavior_tab, 'start_analysis'):
+                return
             
-            self.statusBar().showMessage("一键分析完成")
-            show_info_message(self, "提示", "一键分析完成")
+            self.statusBar().showMessage("正在执行一键分析...")
+            # 在分析线程启动前连接结果信号，避免分析很快结束时错过通知
+            self._connect_one_click_signals(file_behavior_tab, True)
+            self._actions['analyze'].setEnabled(False)
+            if not file_behavior_tab.start_analysis():
+                # 启动失败时标签页已提示错误
+                self._connect_one_click_signals(file_behavior_tab, False)
+                self._actions['analyze'].setEnabled(True)
+                self.statusBar().showMessage("一键分析失败", 2000)
         except Exception as e:
             logging.error("一键分析时出错: " + str(e))
             show_error_message(self, "错误", "一键分析时出错: {}".format(str(e)))
-            self.statusBar().showMessage("一键分析失败")
+            self.statusBar().showMessage("一键分析失败", 2000)
+    
+    def _connect_one_click_signals(self, tab, connect):
+        """连接或断开文件行为分析标签页与一键分析回调之间的信号"""
+        pairs = ((tab.analysis_finished, self.on_one_click_analysis_done),
+                 (tab.analysis_error, self.on_one_click_analysis_error),
+                 (tab.analysis_stopped, self.on_one_click_analysis_stopped))
+        for signal, slot in pairs:
+            if connect:
+                signal.connect(slot)
+            else:
+                try:
+                    signal.disconnect(slot)
+                except TypeError:
+                    pass
+    
+    def on_one_click_analysis_done(self, results):
+        """一键分析完成回调"""
+        self.statusBar().showMessage("一键分析完成", 3000)
+        show_info_message(self, "提示", "一键分析完成")
+    
+    def on_one_click_analysis_error(self, error_msg):
+        """一键分析出错回调，错误详情已由文件行为分析标签页提示"""
+        self.statusBar().showMessage("一键分析失败", 2000)
+    
+    def on_one_click_analysis_stopped(self):
+        """一键分析线程结束后断开回调并恢复一键分析动作，之后标签页内手动分析不再触发一键分析提示"""
+        if self.file_behavior_tab is not None:
+            self._connect_one_click_signals(self.file_behavior_tab, False)
+        self._actions['analyze'].setEnabled(True)
     
     def show_about(self):
         """显示关于对话框"""
         try:
-            QMessageBox.about(self, "关于", 
-                            f"{Config.APP_NAME} v{Config.VERSION}\n\n"
-                            f"系统安全分析工具\n"
-                            f"帮助用户深入了解系统运行状态，检测恶意软件，优化系统性能\n\n"
-                            f"QQ群：1056878281")
+            QMessageBox.about(self, "关于", _ABOUT_BODY)
         except Exception as e:
             logging.error("显示关于对话框时出错: " + str(e))
     
-    def cleanup_resources(self):
-        """清理资源"""
+    def on_master_tick(self):
+        """主定时器节拍：请求性能采样，并按节拍数调度资源清理"""
+        self._master_tick += 1
+        if self._perf_sampler:
+            self.sample_requested.emit()
+        if _MEMORY_CLEANUP_TICKS and self._master_tick % _MEMORY_CLEANUP_TICKS == 0:
+            self.on_resource_timer()
+    
+    def on_resource_timer(self):
+        """定时资源清理：每次回收第0代，每隔若干次回收到第1代、第2代"""
+        self._gc_tick += 1
+        if self._gc_tick % _GC_FULL_TICKS == 0:
+            generation = 2
+        elif self._gc_tick % _GC_GEN1_TICKS == 0:
+            generation = 1
+        else:
+            generation = 0
+        self.cleanup_resources(generation)
+    
+    def cleanup_resources(self, generation=1):
+        """
+        清理资源
+        
+        Args:
+            generation (int): 回收到第几代；完整回收（2）另外在窗口最小化和关闭时执行
+        """
         try:
-            # 强制垃圾回收
-            import gc
-            collected = gc.collect()
+            # 自上次回收以来新分配的对象很少时跳过，空闲时不占用界面线程
+            if generation < 2:
+                count0, count1, _ = gc.get_count()
+                if count0 < _GC_MIN_GEN0 and count1 < _GC_MIN_GEN1:
+                    return
+            collected = gc.collect(generation)
             if collected > 0:
                 logging.info(f"垃圾回收完成，清理了 {collected} 个对象")
         except Exception as e:
             logging.error("清理资源时出错: " + str(e))
     
-    def update_performance_info(self):
-        """更新性能信息"""
+    def changeEvent(self, event):
+        """
+        窗口状态变化事件
+        最小化时暂停主定时器，并趁界面空闲执行完整垃圾回收；还原后恢复定时器
+        （隐藏/显示窗口由hideEvent/showEvent处理）
+        标签页的自动刷新由最小化/还原时的隐藏/显示事件处理
+        """
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.pause_background_timers()
+                self.cleanup_resources(2)
+            elif self.isVisible():
+                self.resume_background_timers()
+        super().changeEvent(event)
+    
+    def hideEvent(self, event):
+        """窗口隐藏时暂停主定时器，不可见期间不再采样性能信息"""
+        self.pause_background_timers()
+        super().hideEvent(event)
+    
+    def showEvent(self, event):
+        """窗口显示时恢复主定时器"""
+        if not self.isMinimized():
+            self.resume_background_timers()
+        super().showEvent(event)
+    
+    def pause_background_timers(self):
+        """暂停主定时器"""
+        if self.master_timer:
+            self.master_timer.stop()
+    
+    def resume_background_timers(self):
+        """恢复主定时器，使用启动时配置的间隔"""
+        if self.master_timer and not self.master_timer.isActive():
+            self.master_timer.start()
+    
+    def update_performance_info(self, memory_mb, cpu_percent):
+        """
+        更新性能信息（界面线程）
+        
+        Args:
+            memory_mb (float): 内存使用量（MB）
+            cpu_percent (float): CPU使用率
+        """
         try:
-            # 获取当前进程
-            process = psutil.Process(os.getpid())
-            
-            # 获取内存使用情况
-            memory_info = process.memory_info()
-            memory_mb = memory_info.rss / 1024 / 1024
-            
-            # 获取CPU使用率
-            cpu_percent = process.cpu_percent()
-            
-            # 更新状态栏显示
-            self.performance_label.setText(
-                f"内存: {memory_mb:.1f} MB | CPU: {cpu_percent:.1f}%"
-            )
+            # 按显示精度比较，数值未变化时不格式化也不重设文本，避免无谓的重绘
+            values = (round(memory_mb, 1), round(cpu_percent, 1))
+            if values != self._last_performance_values:
+                self._last_performance_values = values
+                self.performance_label.setText(_PERFORMANCE_FORMAT.format(*values))
         except Exception as e:
             logging.error("更新性能信息时出错: " + str(e))
     
     def closeEvent(self, event):
         """窗口关闭事件"""
         try:
-            # 停止所有定时器
-            if self.resource_timer:
-                self.resource_timer.stop()
+            # 停止定时器
+            if self.master_timer:
+                self.master_timer.stop()
+            
+            # 结束性能采样线程
+            if self._perf_thread:
+                self._perf_thread.quit()
+                self._perf_thread.wait()
             
-            if self.performance_timer:
-                self.performance_timer.stop()
+            # 断开标签页切换信号，避免销毁过程中触发切换处理和标签页创建
+            self.tab_widget.currentChanged.disconnect(self.on_tab_changed)
             
             # 停止所有标签页的自动刷新
             self.stop_all_auto_refresh()
             
-            # 清理资源
-            self.cleanup_resources()
+            # 释放标签页期间暂停自动垃圾回收，结束后统一做一次完整回收
+            gc.disable()
+            try:
+                self.release_tabs()
+            finally:
+                gc.enable()
+            self.cleanup_resources(2)
             
             logging.info("主窗口关闭事件处理完成")
             event.accept()
@@ -361,18 +617,30 @@ class MainWindow(QMainWindow):
             logging.error("处理窗口关闭事件时出错: " + str(e))
             event.accept()  # 即使出错也接受关闭事件
     
+    def release_tabs(self):
+        """清理已创建的标签页并解除与主窗口的关联"""
+        for attr, _, _, _ in _TAB_SPECS:
+            tab = getattr(self, attr)
+            if tab is None:
+                continue
+            tab.removeEventFilter(self)
+            tab.blockSignals(True)
+            cleanup = self._hook(tab, 'cleanup')
+            try:
+                if cleanup:
+                    cleanup()
+            except Exception as e:
+                logging.error("清理标签页 {} 时出错: {}".format(attr, e))
+            # 标签页本身不持有主窗口引用，这里显式销毁其Qt对象，不依赖Python垃圾回收
+            tab.deleteLater()
+            setattr(self, attr, None)
+        self._tab_hooks.clear()
+    
     def stop_all_auto_refresh(self):
         """停止所有标签页的自动刷新"""
         try:
-            tabs = [
-                self.process_tab, self.network_tab, self.startup_tab,
-                self.registry_tab, self.file_monitor_tab, self.popup_blocker_tab,
-                self.modules_tab, self.sandbox_tab, self.file_behavior_tab
-            ]
-            
-            for tab in tabs:
-                if hasattr(tab, 'stop_auto_refresh'):
-                    tab.stop_auto_refresh()
+            # 只有已创建的标签页连接了该信号，未创建的标签页没有运行中的定时器
+            self.about_to_close.emit()
                     
             logging.info("已停止所有标签页的自动刷新")
         except Exception as e:
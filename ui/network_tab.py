@@ -42,12 +42,16 @@ class NetworkRefreshWorker(QThread):
     """
     network_refresh_finished = pyqtSignal(list)
     
+    def __init__(self, tab):
+        super().__init__()
+        self.tab = tab
+    
     def run(self):
         try:
-            connections = SystemUtils.get_network_connections()
-            self.network_refresh_finished.emit(connections)
+            self.network_refresh_finished.emit(self.tab.refresh_data())
         except Exception as e:
             logger.error(f"后台线程刷新网络连接信息时出错: {e}")
+            self.network_refresh_finished.emit([])
 
 class NetworkTab(QWidget):
     def __init__(self):
@@ -92,6 +96,7 @@ class NetworkTab(QWidget):
         self.connection_table.setColumnCount(8)  # 图标, 类型, 本地IP, 本地端口, 远程IP, 远程端口, 状态, 进程
         self.connection_table.setHorizontalHeaderLabels(['图标', '类型', '本地IP', '本地端口', '远程IP', '远程端口', '状态', '进程'])
         self.connection_table.setSelectionBehavior(QAbstractItemView.SelectRows)  # 选择整行
+        self.connection_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # 表格只读，无需逐个单元格设置标志
         self.connection_table.setAlternatingRowColors(Config.TABLE_ALTERNATING_ROW_COLORS)  # 交替行颜色
         # 启用优化的表格渲染
         self.connection_table.setSortingEnabled(True)
@@ -107,149 +112,159 @@ class NetworkTab(QWidget):
         current_time = int(time.time() * 1000)
         if current_time - self._last_refresh_time < 2000:  # 2秒内不能重复刷新
             return
+        # 上一次后台刷新尚未完成时不重复启动
+        if self.refresh_worker is not None and self.refresh_worker.isRunning():
+            return
+        self._last_refresh_time = current_time
             
         # 不再在每次刷新时自动启动定时器
             
+        # 显示加载状态，连接信息在后台线程获取，无需强制重绘表格
+        self.refresh_btn.setEnabled(False)
+        self.refresh_btn.setText("刷新中...")
+        
+        self.refresh_worker = NetworkRefreshWorker(self)
+        self.refresh_worker.network_refresh_finished.connect(self.on_network_refresh_finished)
+        self.refresh_worker.start()
+        
+    def refresh_data(self):
+        """
+        获取网络连接数据，只做系统调用不访问界面控件，可在后台线程中执行
+        
+        Returns:
+            list: 网络连接列表，每项附带解析好的进程信息
+        """
+        connections = SystemUtils.get_network_connections()
+        for conn in connections:
+            process_info = "N/A"
+            if conn.get('pid'):
+                try:
+                    proc = psutil.Process(conn['pid'])
+                    process_info = f"{proc.name()} (PID: {conn['pid']})"
+                except (psutil.NoSuchProcess, psutil.AccessDenied):
+                    process_info = f"PID: {conn['pid']}"
+            conn['process_info'] = process_info
+        return connections
+    
+    def apply_data(self, connections):
+        """
+        用refresh_data返回的数据更新表格和统计信息，必须在GUI线程中调用
+        
+        Args:
+            connections (list): 网络连接列表
+        """
+        # 优化表格更新，避免频繁重绘
+        self.connection_table.setUpdatesEnabled(False)
+        # 填充期间关闭排序，否则每次setItem都会触发重新排序并使行号错位
+        self.connection_table.setSortingEnabled(False)
+        
         try:
-            # 显示加载状态
-            self.refresh_btn.setEnabled(False)
-            self.refresh_btn.setText("刷新中...")
-            self.refresh_btn.setCursor(Qt.WaitCursor)
-            self.connection_table.repaint()
+            # 清空表格
+            self.connection_table.setRowCount(0)
             
-            # 获取网络连接信息
-            connections = SystemUtils.get_network_connections()
+            # 批量插入行
+            self.connection_table.setRowCount(len(connections))
             
-            # 优化表格更新，避免频繁重绘
-            self.connection_table.setUpdatesEnabled(False)
-            
-            try:
-                # 清空表格
-                self.connection_table.setRowCount(0)
+            # 填充数据
+            for i, conn in enumerate(connections):
+                # 检查是否为可疑连接
+                is_suspicious = self.is_suspicious_connection(conn)
                 
-                # 批量插入行
-                self.connection_table.setRowCount(len(connections))
+                # 进程信息已在refresh_data中解析
+                process_info = conn.get('process_info', "N/A")
                 
-                # 填充数据
-                for i, conn in enumerate(connections):
-                    # 检查是否为可疑连接
-                    is_suspicious = self.is_suspicious_connection(conn)
-                    
-                    # 获取进程信息
-                    process_info = "N/A"
-                    if conn.get('pid'):
-                        try:
-                            proc = psutil.Process(conn['pid'])
-                            process_info = f"{proc.name()} (PID: {conn['pid']})"
-                        except (psutil.NoSuchProcess, psutil.AccessDenied):
-                            process_info = f"PID: {conn['pid']}"
-                    
-                    # 图标列（暂时禁用图标功能）
-                    icon_item = QTableWidgetItem()
-                    # icon = self.get_process_icon(process_info)
-                    # icon_item.setIcon(icon)
-                    icon_item.setFlags(icon_item.flags() & ~Qt.ItemIsEditable)
-                    icon_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    self.connection_table.setItem(i, 0, icon_item)
-                        
-                    # 类型
-                    type_item = QTableWidgetItem(conn['type'])
-                    type_item.setFlags(type_item.flags() & ~Qt.ItemIsEditable)
-                    type_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    self.connection_table.setItem(i, 1, type_item)
-                    
-                    # 本地地址
-                    local_addr = conn['laddr'].split(':')[0] if ':' in str(conn['laddr']) else str(conn['laddr'])
-                    local_item = QTableWidgetItem(local_addr)
-                    local_item.setFlags(local_item.flags() & ~Qt.ItemIsEditable)
-                    local_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    self.connection_table.setItem(i, 2, local_item)
+                # 图标列（暂时禁用图标功能）
+                icon_item = QTableWidgetItem()
+                # icon = self.get_process_icon(process_info)
+                # icon_item.setIcon(icon)
+                icon_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                self.connection_table.setItem(i, 0, icon_item)
                     
-                    # 本地端口
-                    local_port = conn['laddr'].split(':')[1] if ':' in str(conn['laddr']) else ''
-                    local_port_item = QTableWidgetItem(local_port)
-                    local_port_item.setFlags(local_port_item.flags() & ~Qt.ItemIsEditable)
-                    local_port_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    self.connection_table.setItem(i, 3, local_port_item)
-                    
-                    # 远程地址
-                    remote_addr = conn['raddr'].split(':')[0] if ':' in str(conn['raddr']) else str(conn['raddr']) if conn['raddr'] != 'N/A' else ''
-                    remote_item = QTableWidgetItem(remote_addr)
-                    remote_item.setFlags(remote_item.flags() & ~Qt.ItemIsEditable)
-                    remote_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    if is_suspicious:
-                        remote_item.setForeground(Qt.red)  # 可疑连接用红色显示
-                    self.connection_table.setItem(i, 4, remote_item)
-                    
-                    # 远程端口
-                    remote_port = conn['raddr'].split(':')[1] if ':' in str(conn['raddr']) else '' if conn['raddr'] != 'N/A' else ''
-                    remote_port_item = QTableWidgetItem(remote_port)
-                    remote_port_item.setFlags(remote_port_item.flags() & ~Qt.ItemIsEditable)
-                    remote_port_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    if is_suspicious:
-                        remote_port_item.setForeground(Qt.red)
-                    self.connection_table.setItem(i, 5, remote_port_item)
-                    
-                    # 状态
-                    status_item = QTableWidgetItem(conn['status'])
-                    status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-                    status_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    self.connection_table.setItem(i, 6, status_item)
-                    
-                    # 进程信息
-                    process_item = QTableWidgetItem(process_info)
-                    process_item.setFlags(process_item.flags() & ~Qt.ItemIsEditable)
-                    process_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-                    if is_suspicious:
-                        process_item.setForeground(Qt.red)
-                    self.connection_table.setItem(i, 7, process_item)
+                # 类型
+                type_item = QTableWidgetItem(conn['type'])
+                type_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                self.connection_table.setItem(i, 1, type_item)
                 
-                # 调整列宽
-                # 图标列固定宽度
-                self.connection_table.setColumnWidth(0, 32)
+                # 本地地址
+                local_addr = conn['laddr'].split(':')[0] if ':' in str(conn['laddr']) else str(conn['laddr'])
+                local_item = QTableWidgetItem(local_addr)
+                local_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                self.connection_table.setItem(i, 2, local_item)
                 
-                # 自动调整其他列宽
-                for col in range(1, min(8, self.connection_table.columnCount())):
-                    self.connection_table.resizeColumnToContents(col)
-                    # 设置最小宽度
-                    if self.connection_table.columnWidth(col) < 80:
-                        self.connection_table.setColumnWidth(col, 80)
+                # 本地端口
+                local_port = conn['laddr'].split(':')[1] if ':' in str(conn['laddr']) else ''
+                local_port_item = QTableWidgetItem(local_port)
+                local_port_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                self.connection_table.setItem(i, 3, local_port_item)
                 
-            except Exception as e:
-                logger.error(f"更新网络连接表格时出错: {e}")
-                QMessageBox.critical(self, "错误", f"更新网络连接表格时出错: {e}")
-            finally:
-                self.connection_table.setUpdatesEnabled(True)
+                # 远程地址
+                remote_addr = conn['raddr'].split(':')[0] if ':' in str(conn['raddr']) else str(conn['raddr']) if conn['raddr'] != 'N/A' else ''
+                remote_item = QTableWidgetItem(remote_addr)
+                remote_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                if is_suspicious:
+                    remote_item.setForeground(Qt.red)  # 可疑连接用红色显示
+                self.connection_table.setItem(i, 4, remote_item)
+                
+                # 远程端口
+                remote_port = conn['raddr'].split(':')[1] if ':' in str(conn['raddr']) else '' if conn['raddr'] != 'N/A' else ''
+                remote_port_item = QTableWidgetItem(remote_port)
+                remote_port_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                if is_suspicious:
+                    remote_port_item.setForeground(Qt.red)
+                self.connection_table.setItem(i, 5, remote_port_item)
+                
+                # 状态
+                status_item = QTableWidgetItem(conn['status'])
+                status_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                self.connection_table.setItem(i, 6, status_item)
+                
+                # 进程信息
+                process_item = QTableWidgetItem(process_info)
+                process_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
+                if is_suspicious:
+                    process_item.setForeground(Qt.red)
+                self.connection_table.setItem(i, 7, process_item)
             
-            # 统计信息
-            listening_count = sum(1 for conn in connections if conn['status'] == 'LISTEN')
-            external_count = sum(1 for conn in connections if conn['raddr'] != 'N/A')
-            suspicious_count = sum(1 for conn in connections if self.is_suspicious_connection(conn))
+            # 调整列宽
+            # 图标列固定宽度
+            self.connection_table.setColumnWidth(0, 32)
             
-            # 更新信息标签
-            info_text = f"连接数: {len(connections)} | 监听数: {listening_count} | 外连数: {external_count}"
-            if suspicious_count > 0:
-                info_text += f" | 可疑连接: {suspicious_count}"
-            self.info_label.setText(info_text)
+            # 自动调整其他列宽
+            for col in range(1, min(8, self.connection_table.columnCount())):
+                self.connection_table.resizeColumnToContents(col)
+                # 设置最小宽度
+                if self.connection_table.columnWidth(col) < 80:
+                    self.connection_table.setColumnWidth(col, 80)
             
-            logger.info(f"网络连接刷新完成，共 {len(connections)} 个连接")
         except Exception as e:
-            logger.error(f"刷新网络连接时出错: {e}")
-            QMessageBox.critical(self, "错误", f"刷新网络连接时出错: {e}")
+            logger.error(f"更新网络连接表格时出错: {e}")
+            QMessageBox.critical(self, "错误", f"更新网络连接表格时出错: {e}")
         finally:
-            self.refresh_btn.setEnabled(True)
-            self.refresh_btn.setText("刷新")
-            self.refresh_btn.setCursor(Qt.ArrowCursor)
-            
-        self._last_refresh_time = current_time
+            self.connection_table.setSortingEnabled(True)
+            self.connection_table.setUpdatesEnabled(True)
+        
+        # 统计信息
+        listening_count = sum(1 for conn in connections if conn['status'] == 'LISTEN')
+        external_count = sum(1 for conn in connections if conn['raddr'] != 'N/A')
+        suspicious_count = sum(1 for conn in connections if self.is_suspicious_connection(conn))
+        
+        # 更新信息标签
+        info_text = f"连接数: {len(connections)} | 监听数: {listening_count} | 外连数: {external_count}"
+        if suspicious_count > 0:
+            info_text += f" | 可疑连接: {suspicious_count}"
+        self.info_label.setText(info_text)
+        
+        logger.info(f"网络连接刷新完成，共 {len(connections)} 个连接")
         
     def on_network_refresh_finished(self, connections):
         try:
+            self.apply_data(connections)
+        except Exception as e:
+            logger.error(f"刷新网络连接时出错: {e}")
+            QMessageBox.critical(self, "错误", f"刷新网络连接时出错: {e}")
+        finally:
             self.refresh_btn.setEnabled(True)
             self.refresh_btn.setText("刷新")
-            self.refresh_btn.setCursor(Qt.ArrowCursor)
-        except Exception as e:
-            logger.error(f"处理网络连接刷新完成时出错: {e}")
 
     def get_process_icon(self, process_info):
         """
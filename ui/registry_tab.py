@@ -335,13 +335,10 @@ class RegistryTab(QWidget):
         try:
             # 获取主窗口
             main_window = self.window()
-            if main_window:
-                # 查找启动项标签页
-                for i in range(main_window.tab_widget.count()):
-                    if main_window.tab_widget.tabText(i) == "🚀 启动项监控":
-                        main_window.tab_widget.setCurrentIndex(i)
-                        main_window.statusBar().showMessage("已切换到启动项监控标签页")
-                        return
+            # 主窗口按属性名直接切换标签页，标题可能带图标或被改动，不按标题查找
+            if hasattr(main_window, 'show_tab') and main_window.show_tab('startup_tab'):
+                main_window.statusBar().showMessage("已切换到启动项监控标签页")
+                return
                         
             QMessageBox.warning(self, "错误", "无法找到启动项监控标签页")
         except Exception as e:
@@ -9,6 +9,7 @@ import os
 import hashlib
 import time
 import ctypes
+import subprocess
 import sys
 from datetime import datetime
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, 
@@ -39,22 +40,58 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# 管理员权限相关的shell32函数，只在导入时解析一次并声明参数类型（仅Windows可用）
+try:
+    from ctypes import wintypes
+    _shell32 = ctypes.WinDLL('shell32')
+    _IsUserAnAdmin = _shell32.IsUserAnAdmin
+    _IsUserAnAdmin.argtypes = []
+    _IsUserAnAdmin.restype = wintypes.BOOL
+    _ShellExecuteW = _shell32.ShellExecuteW
+    _ShellExecuteW.argtypes = [wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR,
+                               wintypes.LPCWSTR, wintypes.LPCWSTR, ctypes.c_int]
+    _ShellExecuteW.restype = wintypes.HINSTANCE
+    SHELL32_AVAILABLE = True
+except (AttributeError, OSError, ValueError):
+    SHELL32_AVAILABLE = False
+
+
+def _restart_args():
+    """
+    组装以管理员权限重启时传给ShellExecuteW的参数
+    在重启时才读取sys.argv：嵌入运行时sys.argv可能为空
+    
+    Returns:
+        tuple: (窗口, 操作, 程序, 命令行, 工作目录, 显示方式)
+    """
+    argv = [os.path.abspath(sys.argv[0])] + sys.argv[1:] if sys.argv else []
+    # 按Windows规则对参数引号转义
+    return (None, "runas", sys.executable, subprocess.list2cmdline(argv), None, 1)
+
+
 class SandboxTab(QWidget):
     """沙箱标签页"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._is_admin = None  # 管理员权限在进程运行期间不会变化，首次检查后缓存
         self.init_ui()
         self.setStyleSheet(self.get_stylesheet())
         self.check_admin_privileges()
         
     def is_admin(self):
         """检查当前是否具有管理员权限"""
-        try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except Exception as e:
-            logger.error(f"检查管理员权限时出错: {e}")
-            return False
+        if self._is_admin is None:
+            if not SHELL32_AVAILABLE:
+                logger.error("检查管理员权限时出错: shell32不可用")
+                self._is_admin = False
+            else:
+                try:
+                    self._is_admin = bool(_IsUserAnAdmin())
+                except Exception as e:
+                    logger.error(f"检查管理员权限时出错: {e}")
+                    return False
+        return self._is_admin
     
     def check_admin_privileges(self):
         """检查管理员权限并提示用户"""
@@ -134,23 +171,11 @@ class SandboxTab(QWidget):
     def restart_as_admin_direct(self):
         """直接处理管理员权限重启"""
         try:
-            # 获取当前Python解释器路径
-            python_exe = sys.executable
-            # 获取当前脚本路径
-            script_path = os.path.abspath(sys.argv[0])
-            
-            # 构造参数
-            params = ' '.join(sys.argv[1:])
-            
             # 请求以管理员权限运行
-            ret = ctypes.windll.shell32.ShellExecuteW(
-                None, 
-                "runas", 
-                python_exe, 
-                f'"{script_path}" {params}', 
-                None, 
-                1
-            )
+            if not SHELL32_AVAILABLE:
+                raise OSError("shell32不可用")
+            # HINSTANCE返回值为空指针时ctypes给出None
+            ret = _ShellExecuteW(*_restart_args()) or 0
             
             # 如果成功启动管理员进程，则退出当前进程
             if ret > 32:
@@ -12,7 +12,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                              QTableWidget, QTableWidgetItem, QLabel, QMessageBox, 
                              QAbstractItemView, QTextEdit, QDialog, QTreeWidget, 
                              QTreeWidgetItem, QHeaderView, QSplitter)
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 from PyQt5.QtGui import QIcon
 
 # 修复导入问题：使用标准导入方式
@@ -36,6 +36,23 @@ SUSPICIOUS_NAMES = [
     'svchosts', 'lsasss', 'explorerx', 'iexpiore'
 ]
 
+class StartupRefreshWorker(QThread):
+    """
+    后台线程用于获取启动项信息，避免注册表和启动目录扫描阻塞UI线程
+    """
+    startup_refresh_finished = pyqtSignal(list)
+
+    def __init__(self, tab):
+        super().__init__()
+        self.tab = tab
+
+    def run(self):
+        try:
+            self.startup_refresh_finished.emit(self.tab.refresh_data())
+        except Exception as e:
+            logger.error(f"后台线程获取启动项信息时出错: {e}")
+            self.startup_refresh_finished.emit([])
+
 class StartupInfoManager:
     """
     启动项信息管理器，用于统一管理启动项相关信息
@@ -199,6 +216,7 @@ class StartupTab(QWidget):
     def __init__(self):
         super().__init__()
         self._last_refresh_time = 0  # 初始化刷新时间
+        self.refresh_worker = None
         self.startup_info_manager = StartupInfoManager()  # 添加启动项信息管理器
         self.init_ui()
         self.auto_refresh_timer = QTimer()
@@ -241,6 +259,11 @@ class StartupTab(QWidget):
         self.detail_btn.clicked.connect(self.show_detail)
         button_layout.addWidget(self.detail_btn)
         
+        # 按需根据内容调整列宽
+        self.fit_columns_btn = QPushButton('适应列宽')
+        self.fit_columns_btn.clicked.connect(self.fit_table_columns)
+        button_layout.addWidget(self.fit_columns_btn)
+        
         button_layout.addStretch()
         
         # 创建包含表格和树状视图的 splitter
@@ -251,11 +274,22 @@ class StartupTab(QWidget):
         self.startup_table.setColumnCount(5)
         self.startup_table.setHorizontalHeaderLabels(['名称', '路径', '位置', '状态', '备注'])
         self.startup_table.setSelectionBehavior(QAbstractItemView.SelectRows)  # 选择整行
+        self.startup_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # 表格只读，无需逐个单元格设置标志
         self.startup_table.setAlternatingRowColors(Config.TABLE_ALTERNATING_ROW_COLORS)  # 交替行颜色
         # 启用优化的表格渲染
         self.startup_table.setSortingEnabled(True)
         self.startup_table.setWordWrap(False)
         
+        # 使用固定列宽和行高，刷新时不再逐个单元格测量内容
+        self.startup_table.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+        self.startup_table.horizontalHeader().setStretchLastSection(True)
+        self.startup_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.startup_table.verticalHeader().setDefaultSectionSize(24)
+        self.startup_table.setColumnWidth(0, 160)  # 名称
+        self.startup_table.setColumnWidth(1, 400)  # 路径
+        self.startup_table.setColumnWidth(2, 240)  # 位置
+        self.startup_table.setColumnWidth(3, 60)   # 状态
+        
         # 启动项树状视图（默认隐藏）
         self.startup_tree = StartupTreeWidget()
         self.startup_tree.hide()
@@ -268,6 +302,12 @@ class StartupTab(QWidget):
         layout.addWidget(self.view_splitter)
         self.setLayout(layout)
 
+    def fit_table_columns(self):
+        """
+        根据当前内容调整表格列宽（仅在用户请求时执行）
+        """
+        self.startup_table.resizeColumnsToContents()
+
     def toggle_view(self):
         """
         切换视图显示模式（表格/树状）
@@ -290,107 +330,127 @@ class StartupTab(QWidget):
         current_time = int(time.time() * 1000)
         if current_time - self._last_refresh_time < 2000:  # 2秒内不能重复刷新
             return
+        # 上一次后台刷新尚未完成时不重复启动
+        if self.refresh_worker is not None and self.refresh_worker.isRunning():
+            return
+        self._last_refresh_time = current_time
             
+        # 显示加载状态，数据在后台线程获取，界面保持响应
+        self.refresh_btn.setEnabled(False)
+        self.refresh_btn.setText("刷新中...")
+        
+        self.refresh_worker = StartupRefreshWorker(self)
+        self.refresh_worker.startup_refresh_finished.connect(self.on_startup_refresh_finished)
+        self.refresh_worker.start()
+
+    def on_startup_refresh_finished(self, startup_items):
+        """
+        后台线程获取启动项完成后在GUI线程中更新界面
+        """
         try:
-            # 显示加载状态
-            self.refresh_btn.setEnabled(False)
-            self.refresh_btn.setText("刷新中...")
-            self.refresh_btn.setCursor(Qt.WaitCursor)
-            self.startup_table.repaint()
-            
-            # 获取启动项信息
-            startup_items = SystemUtils.get_startup_items()
-            
-            # 保存当前启动项列表供后续使用
-            self.current_startup_items = startup_items
-            
-            # 限制显示的启动项数量，避免界面卡顿
-            if len(startup_items) > Config.MAX_STARTUP_ITEMS_TO_DISPLAY:
-                startup_items = startup_items[:Config.MAX_STARTUP_ITEMS_TO_DISPLAY]
-                logger.debug(f"启动项数量超过限制，仅显示前{Config.MAX_STARTUP_ITEMS_TO_DISPLAY}个启动项")
+            self.apply_data(startup_items)
+        except Exception as e:
+            logger.error(f"刷新启动项时出错: {e}")
+            QMessageBox.critical(self, "错误", f"刷新启动项时出错: {e}")
+        finally:
+            self.refresh_btn.setEnabled(True)
+            self.refresh_btn.setText("刷新")
+
+    def refresh_data(self):
+        """
+        获取启动项数据并检测可疑项，只做系统调用不访问界面控件，可在后台线程中执行
+        
+        Returns:
+            list: 启动项列表，每项附带is_suspicious检测结果
+        """
+        startup_items = SystemUtils.get_startup_items()
+        for item in startup_items:
+            item['is_suspicious'] = SystemUtils.is_suspicious_startup_item(item)
+        return startup_items
+
+    def apply_data(self, startup_items):
+        """
+        用refresh_data返回的数据更新表格、树状视图和统计信息，必须在GUI线程中调用
+        
+        Args:
+            startup_items (list): 启动项列表
+        """
+        # 保存当前启动项列表供后续使用
+        self.current_startup_items = startup_items
+        
+        # 限制显示的启动项数量，避免界面卡顿
+        if len(startup_items) > Config.MAX_STARTUP_ITEMS_TO_DISPLAY:
+            startup_items = startup_items[:Config.MAX_STARTUP_ITEMS_TO_DISPLAY]
+            logger.debug(f"启动项数量超过限制，仅显示前{Config.MAX_STARTUP_ITEMS_TO_DISPLAY}个启动项")
+        
+        # 可疑检测结果已在refresh_data中计算，表格着色和计数共用
+        suspicious_flags = [item.get('is_suspicious', False) for item in startup_items]
+        
+        # 优化表格更新，避免频繁重绘
+        self.startup_table.setUpdatesEnabled(False)  # 暂时禁用更新
+        # 填充期间关闭排序，否则每次setItem都会触发重新排序并使行号错位
+        self.startup_table.setSortingEnabled(False)
+        
+        try:
+            # 清空表格
+            self.startup_table.setRowCount(0)
             
-            # 优化表格更新，避免频繁重绘
-            self.startup_table.setUpdatesEnabled(False)  # 暂时禁用更新
+            # 批量插入行
+            self.startup_table.setRowCount(len(startup_items))
             
-            try:
-                # 清空表格
-                self.startup_table.setRowCount(0)
-                
-                # 批量插入行
-                self.startup_table.setRowCount(len(startup_items))
-                
-                # 填充数据
-                items_to_set = []
-                for i, item in enumerate(startup_items):
-                    # 检测可疑启动项
-                    is_suspicious = SystemUtils.is_suspicious_startup_item(item)
-                    
-                    # 名称
-                    name_item = QTableWidgetItem(item['name'])
-                    name_item.setFlags(name_item.flags() & ~Qt.ItemIsEditable)
-                    if is_suspicious:
-                        name_item.setForeground(Qt.red)  # 可疑启动项用红色显示
-                    items_to_set.append((i, 0, name_item))
-                    
-                    # 路径
-                    path_item = QTableWidgetItem(item['path'])
-                    path_item.setFlags(path_item.flags() & ~Qt.ItemIsEditable)
-                    if is_suspicious:
-                        path_item.setForeground(Qt.red)
-                    items_to_set.append((i, 1, path_item))
-                    
-                    # 位置
-                    location_item = QTableWidgetItem(item['location'])
-                    location_item.setFlags(location_item.flags() & ~Qt.ItemIsEditable)
-                    if is_suspicious:
-                        location_item.setForeground(Qt.red)
-                    items_to_set.append((i, 2, location_item))
-                    
-                    # 状态
-                    status_item = QTableWidgetItem(item['status'])
-                    status_item.setFlags(status_item.flags() & ~Qt.ItemIsEditable)
-                    if is_suspicious:
-                        status_item.setForeground(Qt.red)
-                    items_to_set.append((i, 3, status_item))
-                    
-                    # 备注（可疑原因）
-                    reason = "可疑启动项" if is_suspicious else ""
-                    reason_item = QTableWidgetItem(reason)
-                    reason_item.setFlags(reason_item.flags() & ~Qt.ItemIsEditable)
-                    if is_suspicious:
-                        reason_item.setForeground(Qt.red)
-                    items_to_set.append((i, 4, reason_item))
+            # 填充数据
+            items_to_set = []
+            for i, (item, is_suspicious) in enumerate(zip(startup_items, suspicious_flags)):
+                # 名称
+                name_item = QTableWidgetItem(item['name'])
+                if is_suspicious:
+                    name_item.setForeground(Qt.red)  # 可疑启动项用红色显示
+                items_to_set.append((i, 0, name_item))
                 
-                # 批量设置项目
-                for row, col, item in items_to_set:
-                    self.startup_table.setItem(row, col, item)
+                # 路径
+                path_item = QTableWidgetItem(item['path'])
+                if is_suspicious:
+                    path_item.setForeground(Qt.red)
+                items_to_set.append((i, 1, path_item))
                 
-                # 调整列宽
-                self.startup_table.resizeColumnsToContents()
+                # 位置
+                location_item = QTableWidgetItem(item['location'])
+                if is_suspicious:
+                    location_item.setForeground(Qt.red)
+                items_to_set.append((i, 2, location_item))
                 
-                # 更新树状视图（如果可见）
-                self.update_startup_tree(startup_items)
+                # 状态
+                status_item = QTableWidgetItem(item['status'])
+                if is_suspicious:
+                    status_item.setForeground(Qt.red)
+                items_to_set.append((i, 3, status_item))
                 
-            except Exception as e:
-                logger.error(f"更新启动项表格时出错: {e}")
-                QMessageBox.critical(self, "错误", f"更新启动项表格时出错: {e}")
-            finally:
-                self.startup_table.setUpdatesEnabled(True)
+                # 备注（可疑原因）
+                reason = "可疑启动项" if is_suspicious else ""
+                reason_item = QTableWidgetItem(reason)
+                if is_suspicious:
+                    reason_item.setForeground(Qt.red)
+                items_to_set.append((i, 4, reason_item))
             
-            # 更新信息标签
-            suspicious_count = sum(1 for item in startup_items if SystemUtils.is_suspicious_startup_item(item))
-            self.info_label.setText(f"启动项总数: {len(startup_items)} | 可疑启动项: {suspicious_count}")
+            # 批量设置项目
+            for row, col, item in items_to_set:
+                self.startup_table.setItem(row, col, item)
+            
+            # 更新树状视图（如果可见）
+            self.update_startup_tree(startup_items)
             
-            logger.info(f"启动项刷新完成，共 {len(startup_items)} 个启动项")
         except Exception as e:
-            logger.error(f"刷新启动项时出错: {e}")
-            QMessageBox.critical(self, "错误", f"刷新启动项时出错: {e}")
+            logger.error(f"更新启动项表格时出错: {e}")
+            QMessageBox.critical(self, "错误", f"更新启动项表格时出错: {e}")
         finally:
-            self.refresh_btn.setEnabled(True)
-            self.refresh_btn.setText("刷新")
-            self.refresh_btn.setCursor(Qt.ArrowCursor)
-            
-        self._last_refresh_time = current_time
+            self.startup_table.setSortingEnabled(True)
+            self.startup_table.setUpdatesEnabled(True)
+        
+        # 更新信息标签
+        suspicious_count = sum(suspicious_flags)
+        self.info_label.setText(f"启动项总数: {len(startup_items)} | 可疑启动项: {suspicious_count}")
+        
+        logger.info(f"启动项刷新完成，共 {len(startup_items)} 个启动项")
 
     @performance_monitor
     def update_startup_tree(self, startup_items):
@@ -611,6 +671,17 @@ class StartupTab(QWidget):
     def cleanup(self):
         """清理资源"""
         self.stop_auto_refresh()
+        try:
+            if self.refresh_worker is not None and self.refresh_worker.isRunning():
+                # 先断开结果信号，避免线程结束后向已销毁的标签页发送数据
+                try:
+                    self.refresh_worker.startup_refresh_finished.disconnect(self.on_startup_refresh_finished)
+                except TypeError:
+                    pass
+                # 等待线程结束，线程对象不能在线程运行期间被销毁
+                self.refresh_worker.wait()
+        except RuntimeError:
+            pass
         logger.info("StartupTab 资源清理完成")
         
     def __del__(self):
@@ -15,10 +15,10 @@ if project_dir not in sys.path:
 # 导入SystemUtils和装饰器
 try:
     from .system_utils import SystemUtils, RegistryMonitor, FileMonitor, PEAnalyzer, FileEntropyAnalyzer
-    from .decorators import performance_monitor, memoize_with_ttl
+    from .decorators import performance_monitor, memoize_with_ttl, safe_slot
 
     __all__ = ['SystemUtils', 'RegistryMonitor', 'FileMonitor', 'PEAnalyzer', 'FileEntropyAnalyzer', 
-               'performance_monitor', 'memoize_with_ttl']
+               'performance_monitor', 'memoize_with_ttl', 'safe_slot']
     __version__ = "1.0.0"
 except ImportError as e:
     print(f"⚠️ utils包导入警告: {e}", file=sys.stderr)
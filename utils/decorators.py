@@ -103,4 +103,58 @@ def memoize_with_ttl(ttl_seconds=60):
         # 添加清除缓存的方法
         wrapper.clear_cache = lambda: cache.clear() and timestamps.clear()
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+def safe_slot(max_failures=5):
+    """
+    定时槽函数保护装饰器，捕获异常并在连续失败达到上限后停用该槽函数，
+    避免周期任务反复出错时不断写日志拖慢界面
+    
+    Args:
+        max_failures (int): 允许的最大连续失败次数
+        
+    Returns:
+        function: 装饰器函数
+    """
+    def decorator(func):
+        """
+        decorator函数
+        
+        Args:
+            func (function): 被装饰的函数
+            
+        Returns:
+            function: 装饰后的函数
+        """
+        state = {'failures': 0, 'disabled': False}
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            """
+            wrapper函数
+            
+            Args:
+                *args: 位置参数
+                **kwargs: 关键字参数
+                
+            Returns:
+                any: 被装饰函数的返回值，出错或已停用时返回None
+            """
+            if state['disabled']:
+                return None
+            try:
+                result = func(*args, **kwargs)
+                state['failures'] = 0
+                return result
+            except Exception as e:
+                state['failures'] += 1
+                logger.error(f"{func.__name__} 执行出错: {e}")
+                if state['failures'] >= max_failures:
+                    state['disabled'] = True
+                    logger.warning(f"{func.__name__} 连续失败 {max_failures} 次，已停用")
+                return None
+        
+        # 添加重新启用的方法
+        wrapper.reset = lambda: state.update(failures=0, disabled=False)
+        return wrapper
+    return decorator
@@ -84,10 +84,15 @@ class ResourceManager:
         self.memory_usage_history = []
         self.cpu_usage_history = []
         
-    def collect_garbage(self):
-        """执行垃圾回收"""
+    def collect_garbage(self, generation=2):
+        """
+        执行垃圾回收
+        
+        Args:
+            generation (int): 回收到第几代，默认完整回收
+        """
         try:
-            collected = gc.collect()
+            collected = gc.collect(generation)
             logger.debug(f"垃圾回收完成，回收了 {collected} 个对象")
             return collected
         except Exception as e:
@@ -119,11 +124,19 @@ class ResourceManager:
             logger.error(f"获取CPU使用情况时出错: {e}")
             return {'error': str(e)}
     
-    def log_resource_usage(self):
-        """记录资源使用情况"""
+    def log_resource_usage(self, memory_usage=None, cpu_usage=None):
+        """
+        记录资源使用情况
+        
+        Args:
+            memory_usage (dict): 已采样的内存使用情况，为None时重新获取
+            cpu_usage (dict): 已采样的CPU使用情况，为None时重新获取
+        """
         try:
-            memory_usage = self.get_memory_usage()
-            cpu_usage = self.get_cpu_usage()
+            if memory_usage is None:
+                memory_usage = self.get_memory_usage()
+            if cpu_usage is None:
+                cpu_usage = self.get_cpu_usage()
             
             if 'error' not in memory_usage and 'error' not in cpu_usage:
                 self.memory_usage_history.append(memory_usage['rss'])
@@ -181,6 +194,7 @@ class EnhancedSystemUtils:
             return {'error': str(e)}
     
     @staticmethod
+    @memoize_with_ttl(ttl_seconds=1)  # 1秒缓存，合并同一时刻多个调用方的采样
     @performance_monitor
     def get_cpu_info():
         """获取CPU信息"""
@@ -197,6 +211,7 @@ class EnhancedSystemUtils:
             return {'error': str(e)}
     
     @staticmethod
+    @memoize_with_ttl(ttl_seconds=1)  # 1秒缓存，合并同一时刻多个调用方的采样
     @performance_monitor
     def get_memory_info():
         """获取内存信息"""
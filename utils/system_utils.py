@@ -965,6 +965,8 @@ def memoize_with_ttl(ttl_seconds=60):
 import json
 import os
 import random
+import re
+import stat
 import sys
 from datetime import datetime
 
@@ -991,6 +993,9 @@ SUSPICIOUS_FILE_PATTERNS = [
     '\\Users\\Public\\', '\\ProgramData\\'
 ]
 
+# 可疑文件模式的预编译正则，一次扫描匹配全部模式；与逐个模式判断的实现一致，匹配小写路径
+_SUSPICIOUS_FILE_RE = re.compile('|'.join(re.escape(pattern) for pattern in SUSPICIOUS_FILE_PATTERNS))
+
 # 全局变量用于存储配置初始化状态
 _config_initialized = False
 
@@ -1182,14 +1187,16 @@ class SystemUtils:
             startup_folder = os.path.join(os.environ.get('APPDATA', ''), 
                                         'Microsoft\\Windows\\Start Menu\\Programs\\Startup')
             
-            if os.path.exists(startup_folder):
+            if os.path.isdir(startup_folder):
                 try:
-                    for item in os.listdir(startup_folder):
-                        item_path = os.path.join(startup_folder, item)
-                        if os.path.isfile(item_path):
+                    # scandir返回的目录项自带文件类型，无需对每个文件再做一次stat
+                    with os.scandir(startup_folder) as entries:
+                        for entry in entries:
+                            if not entry.is_file():
+                                continue
                             startup_items.append({
-                                'name': item,
-                                'path': item_path,
+                                'name': entry.name,
+                                'path': entry.path,
                                 'location': 'HKCU\\Software\\Microsoft\\Windows\\CurrentVersion\\Explorer\\StartupApproved\\Run',
                                 'status': '启用'
                             })
@@ -1330,11 +1337,28 @@ class SystemUtils:
             bool: 是否可疑
         """
         try:
-            path_lower = event.get('path', '').lower()
-            return any(pattern in path_lower for pattern in SUSPICIOUS_FILE_PATTERNS)
+            return _SUSPICIOUS_FILE_RE.search(event.get('path', '').lower()) is not None
         except Exception as e:
             logger.error(f"检查文件事件是否可疑时出错: {e}")
             return False
+    
+    @staticmethod
+    def is_suspicious_file_event_batch(events):
+        """
+        批量检查文件事件是否可疑
+        
+        Args:
+            events (list): 文件事件列表
+            
+        Returns:
+            list: 与events一一对应的bool列表
+        """
+        try:
+            search = _SUSPICIOUS_FILE_RE.search
+            return [search(event.get('path', '').lower()) is not None for event in events]
+        except Exception as e:
+            logger.error(f"批量检查文件事件是否可疑时出错: {e}")
+            return [False] * len(events)
 
     @staticmethod
     def get_disk_usage():
@@ -1658,6 +1682,17 @@ class RegistryMonitor:
             self.logger.error(f"删除注册表值时出错 {path}\\{value_name}: {e}")
             return False
 
+class _MonitoredPath:
+    """
+    单个监控路径的状态，添加路径时由一次stat得出
+    """
+    __slots__ = ('path', 'is_dir', 'added_at')
+    
+    def __init__(self, path, is_dir, added_at):
+        self.path = path
+        self.is_dir = is_dir
+        self.added_at = added_at
+
 class FileMonitor:
     """
     文件监控类
@@ -1669,7 +1704,7 @@ class FileMonitor:
         初始化文件监控器
         """
         self.logger = logging.getLogger(__name__)
-        self.monitored_paths = []
+        self.monitored_paths = {}  # 监控路径 -> _MonitoredPath，保持添加顺序
         self.is_monitoring = False
     
     def add_path(self, path):
@@ -1682,14 +1717,17 @@ class FileMonitor:
         Returns:
             bool: 是否成功添加
         """
-        if os.path.exists(path):
-            if path not in self.monitored_paths:
-                self.monitored_paths.append(path)
-                self.logger.info(f"添加监控路径: {path}")
-                return True
-        else:
+        # 只做一次stat，同时判断是否存在以及是否为目录
+        try:
+            st = os.stat(path)
+        except OSError:
             self.logger.warning(f"监控路径不存在: {path}")
             return False
+        if path not in self.monitored_paths:
+            self.monitored_paths[path] = _MonitoredPath(path, stat.S_ISDIR(st.st_mode), time.time())
+            self.logger.info(f"添加监控路径: {path}")
+            return True
+        return False
     
     def remove_path(self, path):
         """
@@ -1702,7 +1740,7 @@ class FileMonitor:
             bool: 是否成功移除
         """
         if path in self.monitored_paths:
-            self.monitored_paths.remove(path)
+            del self.monitored_paths[path]
             self.logger.info(f"移除监控路径: {path}")
             return True
         return False
@@ -1714,7 +1752,20 @@ class FileMonitor:
         Returns:
             list: 监控路径列表
         """
-        return self.monitored_paths[:]
+        return list(self.monitored_paths)
+    
+    def is_directory(self, path):
+        """
+        监控路径是否为目录（使用添加路径时记录的结果，不再访问文件系统）
+        
+        Args:
+            path (str): 监控路径
+            
+        Returns:
+            bool: 是否为目录
+        """
+        info = self.monitored_paths.get(path)
+        return info.is_dir if info is not None else False
     
     def start_monitoring(self):
         """